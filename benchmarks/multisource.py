@@ -0,0 +1,74 @@
+"""
+Benchmark de consultas de instalação mais próxima (*nearest facility*).
+
+Compara uma única execução de Dijkstra com múltiplas origens (super-origem
+virtual, que rotula cada nó com a instalação mais próxima — uma partição de
+Voronoi) com k execuções de origem única seguidas do mínimo por nó.
+
+Uso:
+    python benchmarks/multisource.py [--nodes 20000] [--topology ba] [--ba-m 3] [--gnp-p 0.0003] [--facilities 1 4 16 64]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mindijkstra.arrayheap import ArrayMinHeap
+from mindijkstra.mindijkstra_alg import minHeapDijkstrasAlgorithm
+from mindijkstra.mindijkstra_alg_multisource import minHeapMultiSourceDijkstrasAlgorithm
+
+def nearest_by_single_source_runs(facilities, edges):
+    """k execuções independentes, mantendo para cada nó a menor distância e a instalação correspondente."""
+    best_distances = [-1] * len(edges)
+    best_facilities = [-1] * len(edges)
+    for facility in facilities:
+        distances = minHeapDijkstrasAlgorithm(facility, edges, heapClass=ArrayMinHeap)
+        for vertex, distance in enumerate(distances):
+            if distance != -1 and (best_distances[vertex] == -1 or distance < best_distances[vertex]):
+                best_distances[vertex] = distance
+                best_facilities[vertex] = facility
+    return best_distances, best_facilities
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=20000, help="número de nós (padrão: %(default)s)")
+    parser.add_argument("--topology", default="ba", choices=["gnp", "ba"], help="gerador (padrão: %(default)s)")
+    # Padrões próprios: o p = 1.0 de main.DEFAULT_DENSITIES geraria um grafo completo com 20000 nós.
+    parser.add_argument("--gnp-p", type=float, default=0.0003,
+                        help="probabilidade p de cada aresta no gnp (padrão: %(default)s, grau médio ~6 com 20000 nós)")
+    parser.add_argument("--ba-m", type=int, default=3, help="arestas m por novo nó no ba (padrão: %(default)s)")
+    parser.add_argument("--facilities", type=int, nargs="+", default=[1, 4, 16, 64],
+                        help="quantidades de instalações testadas (padrão: %(default)s)")
+    parser.add_argument("--seed", type=int, default=42, help="semente (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+
+    from main import check_density, convert_nx_to_adj_list, generate_connected_weighted_graph
+
+    try:
+        density = check_density(args.topology, args.gnp_p if args.topology == "gnp" else args.ba_m, args.nodes)
+    except ValueError as error:
+        parser.error(str(error))
+    edges = convert_nx_to_adj_list(generate_connected_weighted_graph(args.nodes, args.topology, density, args.seed))
+    rng = random.Random(args.seed)
+
+    print(f"Grafo {args.topology}: {len(edges)} nós, {sum(map(len, edges))} arcos")
+    print(f"{'k':>5s} {'k execuções (s)':>16s} {'multi-origem (s)':>17s} {'speedup':>8s}")
+    for k in args.facilities:
+        facilities = rng.sample(range(len(edges)), k)
+
+        start_time = time.perf_counter()
+        expected_distances, _ = nearest_by_single_source_runs(facilities, edges)
+        single_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        distances, _ = minHeapMultiSourceDijkstrasAlgorithm(facilities, edges, heapClass=ArrayMinHeap)
+        multi_time = time.perf_counter() - start_time
+
+        assert distances == expected_distances
+        print(f"{k:5d} {single_time:16.3f} {multi_time:17.3f} {single_time / multi_time:7.1f}x")
+
+if __name__ == "__main__":
+    main()
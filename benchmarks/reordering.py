@@ -0,0 +1,153 @@
+"""
+Benchmark de reordenação de vértices.
+
+Gera um grafo com IDs embaralhados (sem localidade), reordena os vértices por
+BFS, Cuthill–McKee reverso e grau, e mede o tempo de Dijkstra em cada ordem:
+nas implementações em memória (Min-Heap e Min-Heap com arrays) e no backend CSR
+em disco (`outofcore`), com um cache de fragmentos menor que o grafo, e, em um
+segundo grafo menor (`--classic-nodes`), no Dijkstra clássico O(V²). Também
+mostra a distância média entre os IDs dos extremos de cada aresta e confere
+que todas as ordens dão as mesmas distâncias.
+
+Uso:
+    python benchmarks/reordering.py [--graph grid|ba|gnp] [--nodes 40000] [--classic-nodes 3000] [--sources 5]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dijkstra.dijkstra_alg import dijkstrasAlgorithm
+from mindijkstra.arrayheap import ArrayMinHeap
+from mindijkstra.mindijkstra_alg import minHeapDijkstrasAlgorithm
+from reorder.orders import ORDERINGS, ReorderedGraph
+
+def grid_graph(nodes_number, rng):
+    """Grade 2D ponderada (parecida com uma malha viária), com `nodes_number` nós aproximadamente."""
+    side = int(nodes_number ** 0.5)
+    edges = [[] for _ in range(side * side)]
+    for row in range(side):
+        for col in range(side):
+            vertex = row * side + col
+            for neighbor in ([vertex + 1] if col + 1 < side else []) + ([vertex + side] if row + 1 < side else []):
+                weight = rng.randint(1, 20)
+                edges[vertex].append([neighbor, weight])
+                edges[neighbor].append([vertex, weight])
+    return edges
+
+def networkx_graph(nodes_number, topology, seed):
+    from main import convert_nx_to_adj_list, generate_connected_weighted_graph
+
+    density = 3 if topology == "ba" else 8 / nodes_number
+    return convert_nx_to_adj_list(generate_connected_weighted_graph(nodes_number, topology, density, seed))
+
+def shuffle_ids(edges, rng):
+    """Renumera os vértices aleatoriamente, destruindo qualquer localidade dos IDs."""
+    permutation = list(range(len(edges)))
+    rng.shuffle(permutation)
+    shuffled = [None] * len(edges)
+    for vertex, neighbors in enumerate(edges):
+        shuffled[permutation[vertex]] = [[permutation[destination], weight] for destination, weight in neighbors]
+    return shuffled
+
+def mean_edge_span(edges):
+    return statistics.fmean(abs(u - v) for u, neighbors in enumerate(edges) for v, _ in neighbors)
+
+def time_engine(engine, sources):
+    """Tempo total de `engine` para as origens e as distâncias de cada execução."""
+    start_time = time.perf_counter()
+    distances = [engine(source) for source in sources]
+    return time.perf_counter() - start_time, distances
+
+def time_csr_backend(edges, sources, shard_size, cache_shards, directory):
+    """Tempo do backend CSR em disco, construído sem reordenar (a ordem já vem do grafo)."""
+    from outofcore.sssp import outOfCoreDijkstrasAlgorithm
+    from outofcore.store import ShardStore, buildShardStore
+
+    path = os.path.join(directory, "edges.txt")
+    with open(path, "w") as file:
+        for u, neighbors in enumerate(edges):
+            for v, weight in neighbors:
+                file.write(f"{u} {v} {weight}\n")
+    buildShardStore(path, os.path.join(directory, "store"), shard_size, directed=True, partition="none")
+    store = ShardStore(os.path.join(directory, "store"), cacheShards=cache_shards)
+    elapsed, distances = time_engine(lambda source: outOfCoreDijkstrasAlgorithm(source, store), sources)
+    return elapsed, distances, store.ioStats()["bytesRead"] / 2 ** 20
+
+def compare_orderings(edges, sources, engines, csr=None):
+    """
+    Imprime, para cada ordem, o tempo de cada implementação (`engines`: nome -> função(start, edges))
+    e, com `csr` = (shard_size, cache_shards), o do backend CSR em disco. As distâncias de todas as
+    implementações e ordens, levadas de volta aos IDs originais, devem ser iguais às da primeira
+    implementação na ordem original: uma permutação errada não pode produzir uma linha rápida.
+    """
+    header = f"{'ordem':8s} {'prep (s)':>9s} {'vão médio':>10s}" + "".join(f" {name:>10s}" for name in engines)
+    print(header + (f" {'CSR disco':>10s} {'MiB lidos':>10s}" if csr else ""))
+
+    expected = None
+    for method in ["original"] + list(ORDERINGS):
+        start_time = time.perf_counter()
+        if method == "original":
+            graph_edges, to_new, to_original = edges, (lambda vertex: vertex), (lambda values: values)
+        else:
+            reordered = ReorderedGraph(edges, method)
+            graph_edges, to_new, to_original = reordered.edges, reordered.rank.__getitem__, reordered.toOriginal
+        preprocessing = time.perf_counter() - start_time
+        new_sources = [to_new(source) for source in sources]
+
+        row = f"{method:8s} {preprocessing:9.2f} {mean_edge_span(graph_edges):10.0f}"
+        runs = [time_engine(lambda source: engine(source, graph_edges), new_sources) for engine in engines.values()]
+        if csr:
+            with tempfile.TemporaryDirectory() as directory:
+                csr_time, csr_distances, mib_read = time_csr_backend(graph_edges, new_sources, *csr, directory)
+            runs.append((csr_time, csr_distances))
+        for elapsed, distances in runs:
+            distances = [to_original(result) for result in distances]
+            if expected is None:
+                expected = distances
+            assert distances == expected, f"distâncias divergentes na ordem {method}"
+        row += "".join(f" {elapsed:10.2f}" for elapsed, _ in runs[:len(engines)])
+        print(row + (f" {csr_time:10.2f} {mib_read:10.1f}" if csr else ""))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--graph", default="grid", choices=["grid", "ba", "gnp"], help="tipo de grafo (padrão: %(default)s)")
+    parser.add_argument("--nodes", type=int, default=40000, help="número de nós (padrão: %(default)s)")
+    parser.add_argument("--classic-nodes", type=int, default=3000,
+                        help="número de nós do grafo do Dijkstra clássico, O(V²) (padrão: %(default)s)")
+    parser.add_argument("--sources", type=int, default=5, help="origens por medição (padrão: %(default)s)")
+    parser.add_argument("--seed", type=int, default=42, help="semente (padrão: %(default)s)")
+    parser.add_argument("--shard-size", type=int, default=256, help="vértices por fragmento do backend CSR")
+    parser.add_argument("--cache-fraction", type=float, default=0.1,
+                        help="fração dos fragmentos mantida em cache no backend CSR (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+
+    def shuffled_graph(nodes_number):
+        if args.graph == "grid":
+            edges = grid_graph(nodes_number, rng)
+        else:
+            edges = networkx_graph(nodes_number, args.graph, args.seed)
+        edges = shuffle_ids(edges, rng)
+        return edges, rng.sample(range(len(edges)), args.sources)
+
+    edges, sources = shuffled_graph(args.nodes)
+    cache_shards = max(1, int(args.cache_fraction * len(edges) / args.shard_size))
+    print(f"Grafo {args.graph}: {len(edges)} nós, {sum(map(len, edges))} arcos, {args.sources} origens")
+    compare_orderings(edges, sources, {
+        "min-heap": minHeapDijkstrasAlgorithm,
+        "array": lambda start, graph_edges: minHeapDijkstrasAlgorithm(start, graph_edges, heapClass=ArrayMinHeap),
+    }, csr=(args.shard_size, cache_shards))
+
+    edges, sources = shuffled_graph(args.classic_nodes)
+    print(f"\nGrafo {args.graph} para o Dijkstra clássico: {len(edges)} nós, {sum(map(len, edges))} arcos")
+    compare_orderings(edges, sources, {"clássico": dijkstrasAlgorithm, "min-heap": minHeapDijkstrasAlgorithm})
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark de tempo de inicialização.
+
+Mede, em processos novos, quanto custa importar os pacotes dos algoritmos e os
+pontos de entrada (`main`, `cli`) além do próprio interpretador, e verifica que
+nenhuma dependência pesada (networkx, numpy, pandas, matplotlib, scipy,
+codecarbon) é carregada só pelo import. Termina com código 1 se algum módulo
+passar do orçamento ou carregar uma dependência pesada.
+
+Uso:
+    python benchmarks/startup.py [--runs 15] [--budget-ms 50]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "dijkstra.dijkstra_alg",
+    "dijkstra.dijkstra_alg_paths",
+    "mindijkstra.mindijkstra_alg",
+    "mindijkstra.mindijkstra_alg_paths",
+    "mindijkstra.mindijkstra_alg_multisource",
+    "mindijkstra.arrayheap",
+    "intdistances",
+    "difftest.engines",
+    "reorder.orders",
+    "report.cache",
+    "main",
+    "cli",
+]
+
+HEAVY_MODULES = ["networkx", "numpy", "pandas", "matplotlib", "scipy", "codecarbon"]
+
+def time_import(statement, runs):
+    """Mediana (em segundos) do tempo de parede de `python -c statement`."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=ROOT, check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+def heavy_modules_loaded(module):
+    """Lista as dependências pesadas presentes em `sys.modules` após importar `module`."""
+    statement = (
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", statement], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return output.split()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=15, help="execuções por módulo (padrão: %(default)s)")
+    parser.add_argument("--budget-ms", type=float, default=50,
+                        help="tempo máximo de import além do interpretador (padrão: %(default)s ms)")
+    args = parser.parse_args(argv)
+
+    baseline = time_import("pass", args.runs)
+    print(f"{'interpretador (python -c pass)':40s} {baseline * 1000:8.1f} ms")
+
+    failures = []
+    for module in MODULES:
+        overhead = time_import(f"import {module}", args.runs) - baseline
+        heavy = heavy_modules_loaded(module)
+        status = "ok"
+        if overhead * 1000 > args.budget_ms:
+            status = "LENTO"
+            failures.append(module)
+        if heavy:
+            status = f"PESADO: {', '.join(heavy)}"
+            failures.append(module)
+        print(f"{'import ' + module:40s} {overhead * 1000:+8.1f} ms  {status}")
+
+    if failures:
+        print(f"\nFalhou: {', '.join(sorted(set(failures)))}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+import pytest
+
+from startup import MODULES, heavy_modules_loaded
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_heavyModulesNotLoaded(module):
+    """
+    Test function checking that importing each core module (in a fresh interpreter) does not load
+    any heavy dependency; the timing budget stays in `benchmarks/startup.py`.
+    """
+    heavy = heavy_modules_loaded(module)
+    assert heavy == [], f"Test failed: importing {module} loads {heavy}"
@@ -0,0 +1,194 @@
+"""
+Interface de linha de comando do experimento.
+
+Exemplos:
+    python cli.py bench --sizes 100 500 --repetitions 3 --measure time
+    python cli.py bench --sizes 1000 10000 100000 --topologies gnp ba --gnp-p 0.001 --ba-m 3 --workers 8
+    python cli.py check --cases 500
+    python cli.py generate --sizes 1000 --topologies ba --ba-m 3 --output-dir grafos
+    python cli.py summarize dijkstra_experiment_raw_results.csv
+    python cli.py plot dijkstra_experiment_summary.csv --output-dir resultados
+    python cli.py report resultados/dijkstra_experiment_raw_results.csv novos/dijkstra_experiment_raw_results.csv
+"""
+import argparse
+import os
+import sys
+
+DEFAULT_SIZES = [100, 500, 1000, 5000]
+
+def _add_graph_arguments(parser):
+    from main import DEFAULT_DENSITIES
+
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='número de nós dos grafos (padrão: %(default)s)')
+    parser.add_argument('--topologies', nargs='+', default=['gnp'], choices=['gnp', 'ba'],
+                        help='gerador de grafos: gnp (Erdős–Rényi) ou ba (Barabási–Albert)')
+    parser.add_argument('--gnp-p', type=float, nargs='+', default=DEFAULT_DENSITIES['gnp'],
+                        help='probabilidade p de cada aresta no gnp, em (0, 1] (padrão: %(default)s)')
+    parser.add_argument('--ba-m', type=int, nargs='+', default=DEFAULT_DENSITIES['ba'],
+                        help='arestas m por novo nó no ba, menor que o número de nós (padrão: %(default)s)')
+    parser.add_argument('--seed', type=int, default=42, help='semente base (padrão: %(default)s)')
+    parser.add_argument('--output-dir', default='.', help='diretório de saída (padrão: %(default)s)')
+
+def _densities(args):
+    """
+    Densidades de cada topologia escolhida (--gnp-p, --ba-m), validadas para todos
+    os tamanhos antes de gerar qualquer grafo.
+    """
+    from main import check_density
+
+    densities = {'gnp': args.gnp_p, 'ba': args.ba_m}
+    try:
+        return {topology: [check_density(topology, density, min(args.sizes)) for density in densities[topology]]
+                for topology in args.topologies}
+    except ValueError as error:
+        sys.exit(f"Densidade inválida: {error}")
+
+def cmd_generate(args):
+    import networkx as nx
+    from main import generate_connected_weighted_graph
+
+    densities = _densities(args)
+    os.makedirs(args.output_dir, exist_ok=True)
+    for idx, (topology, density, nodes_number) in enumerate(
+            (t, d, n) for t in args.topologies for d in densities[t] for n in args.sizes):
+        graph = generate_connected_weighted_graph(nodes_number, topology, density, args.seed + idx)
+        path = os.path.join(args.output_dir, f"{topology}_{nodes_number}_{density}.edgelist")
+        nx.write_weighted_edgelist(graph, path)
+        print(f"{path}: {graph.number_of_nodes()} nós, {graph.number_of_edges()} arestas")
+
+def cmd_check(args):
+    from difftest.harness import runDifferential
+
+    failing = runDifferential(args.cases, args.seed, verbose=True)
+    if failing:
+        sys.exit(f"{len(failing)} caso(s) divergente(s) entre os algoritmos e o networkx")
+    print(f"Verificação diferencial: {args.cases} grafos, todos os algoritmos concordam com o networkx")
+
+def cmd_bench(args):
+    from main import run_experiment
+
+    densities = _densities(args)
+    if args.check:
+        from difftest.harness import runSmokeCheck
+
+        if not runSmokeCheck():
+            sys.exit("Verificação diferencial falhou; varredura cancelada")
+
+    run_experiment(
+        times=args.repetitions,
+        node_sizes=args.sizes,
+        topologies=args.topologies,
+        densities=densities,
+        algorithms=args.algorithms,
+        sources=args.sources,
+        seed=args.seed,
+        workers=args.workers,
+        measure_co2='co2' in args.measure,
+        measure_memory='memory' in args.measure,
+        output_dir=args.output_dir,
+        plots=not args.no_plots,
+        reorder=args.reorder,
+    )
+    if args.report:
+        args.raw = [os.path.join(args.output_dir, "dijkstra_experiment_raw_results.csv")]
+        args.output = os.path.join(args.output_dir, "relatorio.html")
+        args.cache_dir = None
+        args.baseline = None
+        cmd_report(args)
+
+def cmd_summarize(args):
+    import pandas as pd
+    from main import summarize_results
+
+    summary = summarize_results(pd.read_csv(args.raw))
+    summary.to_csv(args.output, index=False)
+    print(f"Tabela de resumo salva em '{args.output}'")
+
+def cmd_plot(args):
+    import pandas as pd
+    from main import generate_plots
+
+    summary = pd.read_csv(args.summary)
+    os.makedirs(args.output_dir, exist_ok=True)
+    generate_plots(summary, args.output_dir, co2=bool(summary['Mean_CO2'].any()))
+    print(f"Gráficos salvos em '{args.output_dir}'")
+
+def cmd_report(args):
+    from main import ALGORITHMS
+    from report.builder import buildReport, loadRawResults
+
+    # Aceita tanto a chave da linha de comando (ex.: classic) quanto o nome exibido
+    baseline = ALGORITHMS[args.baseline][0] if args.baseline in ALGORITHMS else args.baseline
+    stats = buildReport(loadRawResults(args.raw), args.output, args.cache_dir, baseline)
+    print(f"Relatório salvo em '{args.output}': {stats['figures']} gráficos "
+          f"({stats['rendered']} renderizados, {stats['reused']} do cache)")
+
+def build_parser():
+    from main import ALGORITHMS, DEFAULT_ALGORITHMS
+
+    parser = argparse.ArgumentParser(
+        prog='cli.py', description='Comparação de desempenho das implementações de Dijkstra.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate = subparsers.add_parser('generate', help='gera grafos e salva como lista de arestas')
+    _add_graph_arguments(generate)
+    generate.set_defaults(func=cmd_generate)
+
+    bench = subparsers.add_parser('bench', help='executa uma varredura de tamanhos/topologias')
+    _add_graph_arguments(bench)
+    bench.add_argument('--algorithms', nargs='+', default=DEFAULT_ALGORITHMS, choices=list(ALGORITHMS),
+                       help='algoritmos a executar (padrão: %(default)s)')
+    bench.add_argument('--sources', type=int, default=5, help='nós de origem por repetição (padrão: %(default)s)')
+    bench.add_argument('--repetitions', type=int, default=20, help='repetições por grafo (padrão: %(default)s)')
+    bench.add_argument('--workers', type=int, default=1,
+                       help='processos em paralelo, um grafo por processo (padrão: %(default)s)')
+    bench.add_argument('--measure', nargs='+', default=['time', 'co2'], choices=['time', 'co2', 'memory'],
+                       help='medições a registrar; o tempo é sempre medido (padrão: %(default)s)')
+    bench.add_argument('--no-plots', action='store_true', help='não gera os gráficos ao final')
+    bench.add_argument('--report', action='store_true',
+                       help='gera também o relatório HTML (relatorio.html) no diretório de saída')
+    bench.add_argument('--reorder', default='none', choices=['none', 'bfs', 'rcm', 'degree'],
+                       help='renumera os vértices para melhorar a localidade (padrão: %(default)s)')
+    bench.add_argument('--check', action='store_true',
+                       help='executa uma verificação diferencial rápida antes da varredura')
+    bench.set_defaults(func=cmd_bench)
+
+    check = subparsers.add_parser('check', help='compara todos os algoritmos com o networkx em grafos aleatórios')
+    check.add_argument('--cases', type=int, default=200, help='número de grafos (padrão: %(default)s)')
+    check.add_argument('--seed', type=int, default=0, help='semente (padrão: %(default)s)')
+    check.set_defaults(func=cmd_check)
+
+    summarize = subparsers.add_parser('summarize', help='recalcula o resumo a partir dos resultados brutos')
+    summarize.add_argument('raw', help='CSV de resultados brutos')
+    summarize.add_argument('--output', default='dijkstra_experiment_summary.csv',
+                           help='CSV de resumo (padrão: %(default)s)')
+    summarize.set_defaults(func=cmd_summarize)
+
+    plot = subparsers.add_parser('plot', help='gera os gráficos a partir de um resumo')
+    plot.add_argument('summary', help='CSV de resumo')
+    plot.add_argument('--output-dir', default='.', help='diretório de saída (padrão: %(default)s)')
+    plot.set_defaults(func=cmd_plot)
+
+    report = subparsers.add_parser('report', help='gera um relatório HTML autocontido a partir dos resultados brutos')
+    report.add_argument('raw', nargs='+', help='CSV(s) de resultados brutos, concatenados')
+    report.add_argument('--output', default='relatorio.html', help='arquivo HTML (padrão: %(default)s)')
+    report.add_argument('--cache-dir', default=None,
+                        help='cache dos gráficos renderizados (padrão: .report-cache ao lado do relatório)')
+    report.add_argument('--baseline', default=None,
+                        help='algoritmo de referência do speedup, chave ou nome (padrão: Dijkstra Clássico)')
+    report.set_defaults(func=cmd_report)
+
+    return parser
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    # Sem argumentos, mantém o comportamento antigo de `python main.py`: a varredura padrão.
+    if not argv:
+        argv = ['bench']
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Differential fuzzing of every registered engine against `nx.single_source_dijkstra`.
+
+Usage:
+    python -m difftest [--cases 500] [--seed 0] [--shapes sparse zero-weight ...] [--large]
+"""
+import argparse
+import sys
+
+from difftest.engines import DISTANCE_ENGINES, PATH_ENGINES
+from difftest.generators import SHAPES, SMALL_SHAPES
+from difftest.harness import runDifferential
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m difftest", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", type=int, default=500, help="number of random graphs (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the case sequence (default: %(default)s)")
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=SMALL_SHAPES,
+                        help="graph shapes to cycle through (default: all but large)")
+    parser.add_argument("--large", action="store_true", help="also generate large graphs (500-3000 vertices)")
+    parser.add_argument("--no-shrink", action="store_true", help="report failing cases without shrinking them")
+    args = parser.parse_args(argv)
+
+    shapes = args.shapes + (["large"] if args.large and "large" not in args.shapes else [])
+    engines = list(DISTANCE_ENGINES) + list(PATH_ENGINES)
+    print(f"Checking {len(engines)} engines ({', '.join(engines)}) on {args.cases} graphs...")
+
+    failing = runDifferential(args.cases, args.seed, shapes, shrink=not args.no_shrink, verbose=True)
+    if failing:
+        print(f"{len(failing)} failing case(s)")
+        return 1
+    print("All engines agree with the reference.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
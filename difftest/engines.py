@@ -0,0 +1,88 @@
+import os
+import tempfile
+
+from dijkstra.dijkstra_alg import dijkstrasAlgorithm
+from dijkstra.dijkstra_alg_paths import dijkstrasAlgorithmWithPaths
+from mindijkstra.arrayheap import ArrayMinHeap
+from mindijkstra.mindijkstra_alg import minHeapDijkstrasAlgorithm
+from mindijkstra.mindijkstra_alg_multisource import minHeapMultiSourceDijkstrasAlgorithm
+from mindijkstra.mindijkstra_alg_paths import minHeapDijkstrasAlgorithmWithPaths
+from reorder.orders import ORDERINGS, ReorderedGraph
+
+# Engines returning a list of distances (-1 or inf for unreachable vertices), called as engine(start, edges).
+DISTANCE_ENGINES = {
+    "classic": dijkstrasAlgorithm,
+    "minheap": minHeapDijkstrasAlgorithm,
+    "minheap-array": lambda start, edges: minHeapDijkstrasAlgorithm(start, edges, heapClass=ArrayMinHeap),
+}
+
+# Engines returning (distances, previousNodes), called as engine(start, edges).
+PATH_ENGINES = {
+    "classic-paths": dijkstrasAlgorithmWithPaths,
+    "minheap-paths": minHeapDijkstrasAlgorithmWithPaths,
+    "minheap-array-paths": lambda start, edges: minHeapDijkstrasAlgorithmWithPaths(
+        start, edges, heapClass=ArrayMinHeap),
+}
+
+
+def registerEngine(name, engine, withPaths=False):
+    """
+    Registers a new engine so the differential harness validates it against the reference.
+
+    Args:
+        name (str): Unique engine name.
+        engine (callable): Function called as engine(start, edges).
+        withPaths (bool): True if the engine returns (distances, previousNodes) instead of distances.
+    """
+    registry = PATH_ENGINES if withPaths else DISTANCE_ENGINES
+    if name in DISTANCE_ENGINES or name in PATH_ENGINES:
+        raise ValueError(f"Engine {name!r} is already registered")
+    registry[name] = engine
+
+
+def _reorderedEngine(engine, method):
+    """
+    Wraps an engine so it runs on a copy of the graph relabelled by `reorder.orders.ReorderedGraph`.
+    """
+    return lambda start, edges: ReorderedGraph(edges, method).run(engine, start)
+
+
+def _outOfCoreEngine(start, edges):
+    """
+    Runs `outofcore.sssp.outOfCoreDijkstrasAlgorithm` on a shard store built in a temporary directory
+    from the adjacency list, with small shards so that most graphs span several of them.
+    """
+    from outofcore.sssp import outOfCoreDijkstrasAlgorithm
+    from outofcore.store import ShardStore, buildShardStore
+
+    with tempfile.TemporaryDirectory() as storeDir:
+        edgeListPath = os.path.join(storeDir, "edges.txt")
+        with open(edgeListPath, "w") as file:
+            for vertex, arcs in enumerate(edges):
+                for destination, weight in arcs:
+                    file.write(f"{vertex} {destination} {weight}\n")
+            # A zero-weight self-loop on the last vertex pins the number of vertices.
+            file.write(f"{len(edges) - 1} {len(edges) - 1} 0\n")
+        buildShardStore(edgeListPath, os.path.join(storeDir, "store"), shardSize=8, directed=True)
+        store = ShardStore(os.path.join(storeDir, "store"), cacheShards=2)
+        distances = outOfCoreDijkstrasAlgorithm(start, store)
+        del store
+    return distances
+
+
+registerEngine("minheap-multisource", lambda start, edges: minHeapMultiSourceDijkstrasAlgorithm([start], edges)[0])
+registerEngine("classic-int", lambda start, edges: dijkstrasAlgorithm(start, edges, integerWeights=True))
+registerEngine("minheap-int", lambda start, edges: minHeapDijkstrasAlgorithm(start, edges, integerWeights=True))
+registerEngine("minheap-array-int", lambda start, edges: minHeapDijkstrasAlgorithm(
+    start, edges, heapClass=ArrayMinHeap, integerWeights=True))
+registerEngine("classic-paths-int", lambda start, edges: dijkstrasAlgorithmWithPaths(
+    start, edges, integerWeights=True), withPaths=True)
+registerEngine("minheap-paths-int", lambda start, edges: minHeapDijkstrasAlgorithmWithPaths(
+    start, edges, integerWeights=True), withPaths=True)
+registerEngine("minheap-array-paths-int", lambda start, edges: minHeapDijkstrasAlgorithmWithPaths(
+    start, edges, heapClass=ArrayMinHeap, integerWeights=True), withPaths=True)
+for _method in ORDERINGS:
+    registerEngine(f"minheap-{_method}", _reorderedEngine(minHeapDijkstrasAlgorithm, _method))
+    registerEngine(f"minheap-paths-{_method}", _reorderedEngine(minHeapDijkstrasAlgorithmWithPaths, _method),
+                   withPaths=True)
+registerEngine("outofcore", _outOfCoreEngine)
@@ -0,0 +1,122 @@
+from collections import namedtuple
+
+# A test case: `arcs` is a list of directed (source, destination, weight) triples; undirected graphs
+# simply contain both directions. `source` is the start vertex handed to the engines.
+GraphCase = namedtuple("GraphCase", ["shape", "numberOfVertices", "arcs", "source"])
+
+
+def toAdjacencyList(case):
+    """
+    Builds the adjacency list expected by the engines from a GraphCase.
+
+    Returns:
+        list: One list of [destination, weight] pairs per vertex.
+    """
+    edges = [[] for _ in range(case.numberOfVertices)]
+    for u, v, weight in case.arcs:
+        edges[u].append([v, weight])
+    return edges
+
+
+def _randomArcs(rng, vertices, numberOfEdges, directed, minWeight=1, maxWeight=20):
+    arcs = []
+    if len(vertices) < 2:
+        return arcs
+    for _ in range(numberOfEdges):
+        u, v = rng.sample(vertices, 2)
+        weight = rng.randint(minWeight, maxWeight)
+        arcs.append((u, v, weight))
+        if not directed:
+            arcs.append((v, u, weight))
+    return arcs
+
+
+def sparseGraph(rng):
+    n = rng.randint(1, 40)
+    return n, _randomArcs(rng, list(range(n)), rng.randint(0, 2 * n), directed=False)
+
+
+def denseGraph(rng):
+    n = rng.randint(2, 25)
+    arcs = []
+    for u in range(n):
+        for v in range(u + 1, n):
+            if rng.random() < 0.8:
+                weight = rng.randint(1, 20)
+                arcs += [(u, v, weight), (v, u, weight)]
+    return n, arcs
+
+
+def disconnectedGraph(rng):
+    n = rng.randint(2, 40)
+    vertices = list(range(n))
+    rng.shuffle(vertices)
+    arcs = []
+    numberOfComponents = rng.randint(2, max(2, n // 3))
+    for componentIdx in range(numberOfComponents):
+        component = vertices[componentIdx::numberOfComponents]
+        arcs += _randomArcs(rng, component, rng.randint(0, 2 * len(component)), directed=False)
+    return n, arcs
+
+
+def zeroWeightGraph(rng):
+    n = rng.randint(2, 30)
+    return n, _randomArcs(rng, list(range(n)), rng.randint(n, 3 * n), directed=False, minWeight=0, maxWeight=2)
+
+
+def parallelEdgesGraph(rng):
+    n, arcs = sparseGraph(rng)
+    duplicates = [(u, v, rng.randint(1, 20)) for u, v, _ in rng.sample(arcs, len(arcs) // 2)]
+    arcs += duplicates
+    rng.shuffle(arcs)
+    return n, arcs
+
+
+def selfLoopsGraph(rng):
+    n, arcs = sparseGraph(rng)
+    arcs += [(u, u, rng.randint(0, 20)) for u in rng.sample(range(n), rng.randint(1, n))]
+    rng.shuffle(arcs)
+    return n, arcs
+
+
+def directedGraph(rng):
+    n = rng.randint(1, 40)
+    return n, _randomArcs(rng, list(range(n)), rng.randint(0, 3 * n), directed=True)
+
+
+def mixedGraph(rng):
+    n = rng.randint(1, 30)
+    arcs = _randomArcs(rng, list(range(n)), rng.randint(0, 3 * n), directed=True, minWeight=0, maxWeight=5)
+    arcs += [(u, v, rng.randint(0, 5)) for u, v, _ in arcs[: len(arcs) // 3]]
+    arcs += [(u, u, rng.randint(0, 5)) for u in range(n) if rng.random() < 0.2]
+    rng.shuffle(arcs)
+    return n, arcs
+
+
+def largeGraph(rng):
+    n = rng.randint(500, 3000)
+    return n, _randomArcs(rng, list(range(n)), 3 * n, directed=rng.random() < 0.5)
+
+
+# Shape name -> generator(rng) returning (numberOfVertices, arcs).
+SHAPES = {
+    "sparse": sparseGraph,
+    "dense": denseGraph,
+    "disconnected": disconnectedGraph,
+    "zero-weight": zeroWeightGraph,
+    "parallel-edges": parallelEdgesGraph,
+    "self-loops": selfLoopsGraph,
+    "directed": directedGraph,
+    "mixed": mixedGraph,
+    "large": largeGraph,
+}
+
+SMALL_SHAPES = [shape for shape in SHAPES if shape != "large"]
+
+
+def generateCase(rng, shape):
+    """
+    Generates a random GraphCase of the given shape with a random source vertex.
+    """
+    numberOfVertices, arcs = SHAPES[shape](rng)
+    return GraphCase(shape, numberOfVertices, arcs, rng.randrange(numberOfVertices))
@@ -0,0 +1,243 @@
+import heapq
+import random
+
+from difftest.engines import DISTANCE_ENGINES, PATH_ENGINES
+from difftest.generators import SMALL_SHAPES, generateCase, toAdjacencyList
+
+
+def referenceDistances(case):
+    """
+    Computes the expected distances with `nx.single_source_dijkstra`, falling back to a plain
+    heapq implementation when networkx is not installed.
+
+    Returns:
+        list: Distance from the source to each vertex, -1 for unreachable vertices.
+    """
+    try:
+        import networkx as nx
+    except ImportError:
+        return _heapqDistances(case)
+
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from(range(case.numberOfVertices))
+    graph.add_weighted_edges_from(case.arcs)
+    distances, _ = nx.single_source_dijkstra(graph, case.source)
+    return [distances.get(vertex, -1) for vertex in range(case.numberOfVertices)]
+
+
+def _heapqDistances(case):
+    edges = toAdjacencyList(case)
+    distances = [-1] * case.numberOfVertices
+    queue = [(0, case.source)]
+    while queue:
+        distance, vertex = heapq.heappop(queue)
+        if distances[vertex] != -1:
+            continue
+        distances[vertex] = distance
+        for destination, weight in edges[vertex]:
+            if distances[destination] == -1:
+                heapq.heappush(queue, (distance + weight, destination))
+    return distances
+
+
+def _normalize(distances):
+    return [-1 if distance == float("inf") else distance for distance in distances]
+
+
+def _compareDistances(name, expected, got):
+    if len(got) != len(expected):
+        return f"{name}: returned {len(got)} distances, expected {len(expected)}"
+    for vertex, (want, have) in enumerate(zip(expected, got)):
+        if want != have:
+            return f"{name}: distance to {vertex} is {have}, expected {want}"
+    return None
+
+
+def _checkPredecessors(name, case, expected, previousNodes):
+    """
+    Checks that every reachable vertex has a predecessor on a shortest path, that unreachable vertices
+    have none, and that following the predecessors always leads back to the source.
+    """
+    minWeights = {}
+    for u, v, weight in case.arcs:
+        if (u, v) not in minWeights or weight < minWeights[(u, v)]:
+            minWeights[(u, v)] = weight
+
+    for vertex in range(case.numberOfVertices):
+        if vertex == case.source:
+            continue
+        predecessor = previousNodes[vertex]
+        if expected[vertex] == -1:
+            if predecessor is not None:
+                return f"{name}: unreachable vertex {vertex} has predecessor {predecessor}"
+            continue
+        if predecessor is None or (predecessor, vertex) not in minWeights:
+            return f"{name}: vertex {vertex} has invalid predecessor {predecessor}"
+        if expected[predecessor] + minWeights[(predecessor, vertex)] != expected[vertex]:
+            return f"{name}: predecessor {predecessor} of {vertex} is not on a shortest path"
+
+        # Walk back to the source; more than V steps means the predecessors form a cycle.
+        current, steps = vertex, 0
+        while current != case.source and current is not None and steps <= case.numberOfVertices:
+            current = previousNodes[current]
+            steps += 1
+        if current != case.source:
+            return f"{name}: predecessors of {vertex} do not lead back to the source"
+    return None
+
+
+def checkCase(case, distanceEngines=None, pathEngines=None):
+    """
+    Runs every engine on a GraphCase and compares them with the reference.
+
+    Args:
+        case (GraphCase): The graph and source vertex to test.
+        distanceEngines (dict): Name -> engine returning distances. Defaults to all registered engines.
+        pathEngines (dict): Name -> engine returning (distances, previousNodes). Defaults to all registered
+                            engines.
+
+    Returns:
+        list: One message per failing engine; empty if all engines agree with the reference.
+    """
+    if distanceEngines is None:
+        distanceEngines = DISTANCE_ENGINES
+    if pathEngines is None:
+        pathEngines = PATH_ENGINES
+
+    expected = referenceDistances(case)
+    failures = []
+
+    for name, engine in distanceEngines.items():
+        try:
+            got = _normalize(engine(case.source, toAdjacencyList(case)))
+        except Exception as error:
+            failures.append(f"{name}: raised {error!r}")
+            continue
+        message = _compareDistances(name, expected, got)
+        if message:
+            failures.append(message)
+
+    for name, engine in pathEngines.items():
+        try:
+            distances, previousNodes = engine(case.source, toAdjacencyList(case))
+        except Exception as error:
+            failures.append(f"{name}: raised {error!r}")
+            continue
+        message = (_compareDistances(name, expected, _normalize(distances))
+                   or _checkPredecessors(name, case, expected, previousNodes))
+        if message:
+            failures.append(message)
+
+    return failures
+
+
+def _removeVertex(case, removed):
+    def renumber(vertex):
+        return vertex - 1 if vertex > removed else vertex
+
+    arcs = [(renumber(u), renumber(v), weight) for u, v, weight in case.arcs if removed not in (u, v)]
+    return case._replace(numberOfVertices=case.numberOfVertices - 1, arcs=arcs, source=renumber(case.source))
+
+
+def shrinkCase(case, fails):
+    """
+    Greedily shrinks a failing GraphCase: drops arcs (in halving chunks), then vertices, then lowers
+    weights, as long as `fails(candidate)` still holds.
+
+    Args:
+        case (GraphCase): A case for which `fails(case)` is True.
+        fails (callable): Predicate telling whether a candidate case still reproduces the failure.
+
+    Returns:
+        GraphCase: A locally minimal failing case.
+    """
+    changed = True
+    while changed:
+        changed = False
+
+        chunk = max(1, len(case.arcs) // 2)
+        while chunk >= 1:
+            idx = 0
+            while idx < len(case.arcs):
+                candidate = case._replace(arcs=case.arcs[:idx] + case.arcs[idx + chunk:])
+                if fails(candidate):
+                    case, changed = candidate, True
+                else:
+                    idx += chunk
+            chunk //= 2
+
+        for vertex in reversed(range(case.numberOfVertices)):
+            if vertex == case.source:
+                continue
+            candidate = _removeVertex(case, vertex)
+            if fails(candidate):
+                case, changed = candidate, True
+
+        for idx, (u, v, weight) in enumerate(case.arcs):
+            for smallerWeight in sorted({0, 1, weight // 2}):
+                if smallerWeight >= weight:
+                    break
+                arcs = list(case.arcs)
+                arcs[idx] = (u, v, smallerWeight)
+                candidate = case._replace(arcs=arcs)
+                if fails(candidate):
+                    case, changed = candidate, True
+                    break
+
+    return case
+
+
+def runDifferential(numberOfCases=200, seed=0, shapes=None, shrink=True, verbose=False):
+    """
+    Generates random graphs of every shape and checks all registered engines on them.
+
+    Each case is generated from its own seed (reported on failure), so a failing case can be
+    reproduced with `generateCase(random.Random(caseSeed), shape)`.
+
+    Args:
+        numberOfCases (int): Number of random graphs to check.
+        seed (int): Seed for the sequence of cases.
+        shapes (list): Shapes to cycle through. Defaults to every shape except "large".
+        shrink (bool): Whether to shrink failing cases.
+        verbose (bool): Print every failure as it is found.
+
+    Returns:
+        list: (caseSeed, case, shrunkCase, failures) for every failing case.
+    """
+    if shapes is None:
+        shapes = SMALL_SHAPES
+    rng = random.Random(seed)
+    failing = []
+
+    for caseIdx in range(numberOfCases):
+        shape = shapes[caseIdx % len(shapes)]
+        caseSeed = rng.randrange(2 ** 32)
+        case = generateCase(random.Random(caseSeed), shape)
+        failures = checkCase(case)
+        if not failures:
+            continue
+
+        if shrink:
+            # Shrink against the first failing engine only, so the shrunk case keeps the same bug.
+            name = failures[0].split(":", 1)[0]
+            engines = ({name: DISTANCE_ENGINES[name]} if name in DISTANCE_ENGINES else {},
+                       {name: PATH_ENGINES[name]} if name in PATH_ENGINES else {})
+            shrunk = shrinkCase(case, lambda candidate: bool(checkCase(candidate, *engines)))
+        else:
+            shrunk = case
+        failing.append((caseSeed, case, shrunk, checkCase(shrunk)))
+        if verbose:
+            print(f"[{shape}] case seed {caseSeed}: {failures[0]}")
+            print(f"  shrunk to {shrunk.numberOfVertices} vertices, source {shrunk.source}, arcs {shrunk.arcs}")
+
+    return failing
+
+
+def runSmokeCheck(numberOfCases=60, seed=0):
+    """
+    Quick differential check used by the benchmark driver before a sweep.
+
+    Returns:
+        bool: True if every engine agrees with the reference on all cases.
+    """
+    return not runDifferential(numberOfCases, seed, verbose=True)
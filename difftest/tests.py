@@ -0,0 +1,69 @@
+import random
+
+from difftest.generators import SHAPES, GraphCase, generateCase, toAdjacencyList
+from difftest.harness import checkCase, referenceDistances, runDifferential, shrinkCase
+
+
+def test_registeredEnginesAgreeWithReference():
+    """
+    Every registered engine must agree with `nx.single_source_dijkstra` on random graphs of every
+    small shape (disconnected, zero weights, parallel edges, self-loops, directed, ...).
+    """
+    failing = runDifferential(numberOfCases=270, seed=1234)
+    assert failing == [], f"Failing cases: {[(seed, failures) for seed, _, _, failures in failing]}"
+
+
+def test_largeGraphs():
+    """
+    The engines agree with the reference on a couple of large graphs.
+    """
+    rng = random.Random(7)
+    for _ in range(2):
+        case = generateCase(rng, "large")
+        assert checkCase(case) == []
+
+
+def test_generatorsProduceValidCases():
+    """
+    Generated arcs only reference existing vertices, and the source is a valid vertex.
+    """
+    rng = random.Random(0)
+    for shape in SHAPES:
+        case = generateCase(rng, shape)
+        assert 0 <= case.source < case.numberOfVertices
+        assert all(0 <= u < case.numberOfVertices and 0 <= v < case.numberOfVertices and weight >= 0
+                   for u, v, weight in case.arcs)
+        assert sum(len(neighbors) for neighbors in toAdjacencyList(case)) == len(case.arcs)
+
+
+def test_brokenEngineIsDetectedAndShrunk():
+    """
+    An engine that ignores zero-weight edges must be reported, and shrinking must reduce the failing
+    graph to a single zero-weight arc out of the source.
+    """
+    def ignoresZeroWeights(start, edges):
+        filtered = [[[destination, weight] for destination, weight in neighbors if weight > 0]
+                    for neighbors in edges]
+        distances = referenceDistances(GraphCase("", len(edges), [
+            (u, v, weight) for u, neighbors in enumerate(filtered) for v, weight in neighbors], start))
+        return distances
+
+    case = GraphCase("zero-weight", 6, [(0, 1, 3), (1, 2, 0), (2, 3, 4), (3, 4, 0), (4, 5, 1), (5, 0, 2)], 0)
+    engines = ({"ignores-zero": ignoresZeroWeights}, {})
+    assert checkCase(case, *engines)
+
+    shrunk = shrinkCase(case, lambda candidate: bool(checkCase(candidate, *engines)))
+    assert shrunk.numberOfVertices == 2
+    assert shrunk.arcs == [(shrunk.source, 1 - shrunk.source, 0)]
+
+
+def test_invalidPredecessorsAreDetected():
+    """
+    A path engine with correct distances but a predecessor cycle must be reported.
+    """
+    def cyclicPredecessors(start, edges):
+        return [0, 0, 0], [None, 2, 1]
+
+    case = GraphCase("zero-weight", 3, [(0, 1, 0), (1, 2, 0), (2, 1, 0)], 0)
+    failures = checkCase(case, {}, {"cyclic": cyclicPredecessors})
+    assert failures and "cyclic" in failures[0]
@@ -1,5 +1,7 @@
+from intdistances import UNREACHED, integerDistanceErrors, toSignedList
+
 # O(V^2 + E) time | O(V) space - where V is the number of vertices and E is the number of edges in the input graph
-def dijkstrasAlgorithm(start: int, edges: list):
+def dijkstrasAlgorithm(start: int, edges: list, integerWeights: bool = False):
     """
     Implements Dijkstra's algorithm to find the shortest path from a starting node to all other nodes in a graph.
 
@@ -7,11 +9,16 @@ def dijkstrasAlgorithm(start: int, edges: list):
         start (int): The starting node index.
         edges (list of list): Adjacency list representing the graph. Each index corresponds to a vertex,
                             and each entry is a list of pairs [destination, weight].
+        integerWeights (bool): If True, all weights are non-negative ints and distances are kept as
+                               ints, without float("inf") (see `integerDijkstrasAlgorithm`).
 
     Returns:
         list: A list of the shortest distances from the starting node to each node. If a node is not reachable,
             the distance is -1.
     """
+    if integerWeights:
+        return integerDijkstrasAlgorithm(start, edges)
+
     numberOfVertices = len(edges)
 
     # Initialize the minimum distances for all vertices as infinity
@@ -54,18 +61,57 @@ def dijkstrasAlgorithm(start: int, edges: list):
     return list(map(lambda x: -1 if x == float("inf") else x, minDistances))
 
 
-def getVertexWithMinDistance(distances, visited):
+def integerDijkstrasAlgorithm(start: int, edges: list):
+    """
+    Integer-distance version of `dijkstrasAlgorithm` for graphs with non-negative int weights.
+
+    The algorithm, including the O(V) search of `getVertexWithMinDistance`, is unchanged: only the
+    distances differ. Unreached vertices hold an all-ones int sentinel instead of float("inf"), which
+    `toSignedList` turns into -1 in one pass run in C, instead of the Python-level map of the float version.
+
+    Raises:
+        OverflowError: If a shortest path distance exceeds the int64 range (weights must fit in int64).
+        TypeError: If a weight is not an int.
+    """
+    numberOfVertices = len(edges)
+
+    minDistances = [UNREACHED] * numberOfVertices
+    minDistances[start] = 0
+    visited = set()
+
+    with integerDistanceErrors(edges):
+        while len(visited) != numberOfVertices:
+            vertex, currentMinDistance = getVertexWithMinDistance(minDistances, visited, UNREACHED)
+            if currentMinDistance == UNREACHED:
+                break
+            visited.add(vertex)
+
+            for destination, distanceToDestination in edges[vertex]:
+                if destination in visited:
+                    continue
+                newPathDistance = currentMinDistance + distanceToDestination
+                if newPathDistance < minDistances[destination]:
+                    minDistances[destination] = newPathDistance
+                elif newPathDistance >= UNREACHED:
+                    raise OverflowError(newPathDistance)
+
+        return toSignedList(minDistances)
+
+
+def getVertexWithMinDistance(distances, visited, unreached=float("inf")):
     """
     Helper function to find the vertex with the smallest known distance that has not been visited.
 
     Args:
         distances (list): A list of the shortest known distances to each vertex.
         visited (set): A set of vertices that have already been visited.
+        unreached: The distance of unreached vertices (UNREACHED in integer mode, so that every
+                   comparison is between ints).
 
     Returns:
         tuple: The index of the vertex with the smallest distance and its distance value.
     """
-    currentMinDistance = float("inf")
+    currentMinDistance = unreached
     vertex = -1
 
     # Iterate over all vertices to find the one with the smallest distance.
@@ -1,4 +1,6 @@
-def dijkstrasAlgorithmWithPaths(start, edges):
+from intdistances import UNREACHED, integerDistanceErrors, toSignedList
+
+def dijkstrasAlgorithmWithPaths(start, edges, integerWeights=False):
     """
     Implements Dijkstra's algorithm to find the shortest paths from a starting node to all other nodes in a graph.
     Additionally, it tracks the path to each node using a predecessor list.
@@ -7,14 +9,19 @@ def dijkstrasAlgorithmWithPaths(start, edges):
         start (int): The starting node index.
         edges (list of list): Adjacency list representing the graph. Each index corresponds to a vertex,
                               and each entry is a list of pairs [destination, weight].
+        integerWeights (bool): If True, all weights are non-negative ints and distances are kept as
+                               ints, without float("inf") (see `integerDijkstrasAlgorithmWithPaths`).
 
     Returns:
         tuple: A tuple containing:
             - minDistances (list): A list of the shortest distances from the starting node to each node.
-                                   If a node is unreachable, its distance is `inf`.
+                                   If a node is unreachable, its distance is `inf` (-1 with integerWeights).
             - previousNodes (list): A list where each index points to the predecessor of the node
                                     in the shortest path. `None` if no path exists.
     """
+    if integerWeights:
+        return integerDijkstrasAlgorithmWithPaths(start, edges)
+
     numberOfVertices = len(edges)
 
     # Initialize the minimum distances with infinity, except for the starting node (distance 0).
@@ -59,18 +66,58 @@ def dijkstrasAlgorithmWithPaths(start, edges):
     return minDistances, previousNodes
 
 
-def getVertexWithMinDistance(distances, visited):
+def integerDijkstrasAlgorithmWithPaths(start, edges):
+    """
+    Integer-distance version of `dijkstrasAlgorithmWithPaths` for graphs with non-negative int weights,
+    built like `dijkstra_alg.integerDijkstrasAlgorithm`. Unreachable vertices get a distance of -1 and a
+    `None` predecessor.
+
+    Raises:
+        OverflowError: If a shortest path distance exceeds the int64 range (weights must fit in int64).
+        TypeError: If a weight is not an int.
+    """
+    numberOfVertices = len(edges)
+
+    minDistances = [UNREACHED] * numberOfVertices
+    minDistances[start] = 0
+    visited = set()
+    previousNodes = [None] * numberOfVertices
+
+    with integerDistanceErrors(edges):
+        while len(visited) != numberOfVertices:
+            vertex, currentMinDistance = getVertexWithMinDistance(minDistances, visited, UNREACHED)
+            if currentMinDistance == UNREACHED:
+                break
+            visited.add(vertex)
+
+            for destination, distanceToDestination in edges[vertex]:
+                if destination in visited:
+                    continue
+                newPathDistance = currentMinDistance + distanceToDestination
+                if newPathDistance <= minDistances[destination]:
+                    if newPathDistance == UNREACHED:
+                        raise OverflowError(newPathDistance)
+                    minDistances[destination] = newPathDistance
+                    previousNodes[destination] = vertex
+                elif newPathDistance >= UNREACHED:
+                    raise OverflowError(newPathDistance)
+
+        return toSignedList(minDistances), previousNodes
+
+
+def getVertexWithMinDistance(distances, visited, unreached=float("inf")):
     """
     Helper function to find the unvisited node with the smallest known distance.
 
     Args:
         distances (list): A list of the shortest known distances to each node.
         visited (set): A set of already visited nodes.
+        unreached: The distance of unreached nodes (UNREACHED in integer mode).
 
     Returns:
         tuple: The index of the node with the smallest distance and its distance value.
     """
-    currentMinDistance = float("inf")
+    currentMinDistance = unreached
     vertex = -1
 
     # Iterate over all nodes to find the one with the smallest distance.
@@ -24,8 +24,6 @@ def test_dijkstras_algorithm():
 
     print("Test passed: Output matches expected result.")
 
-# Run the test
-test_dijkstras_algorithm()
 
 def test_dijkstrasAlgorithmWithPaths():
     # Input graph (adjacency list)
@@ -61,5 +59,46 @@ def test_dijkstrasAlgorithmWithPaths():
 
     print("All tests passed!")
 
-# Run the test
-test_dijkstrasAlgorithmWithPaths()
\ No newline at end of file
+
+def test_integerWeights():
+    # Same graph, integer-distance mode: -1 for unreachable nodes in both engines
+    edges = [
+        [[1, 7]],               # Node 0 -> Node 1 (weight 7)
+        [[2, 6], [3, 20], [4, 3]],  # Node 1 -> Nodes 2 (6), 3 (20), 4 (3)
+        [[3, 14]],              # Node 2 -> Node 3 (weight 14)
+        [[4, 2]],               # Node 3 -> Node 4 (weight 2)
+        [],                     # Node 4 has no outgoing edges
+        []                      # Node 5 has no outgoing edges
+    ]
+    start = 0
+
+    result = dijkstrasAlgorithm(start, edges, integerWeights=True)
+    assert result == [0, 7, 13, 27, 10, -1], f"Test failed: {result}"
+
+    minDistances, previousNodes = dijkstrasAlgorithmWithPaths(start, edges, integerWeights=True)
+    assert minDistances == [0, 7, 13, 27, 10, -1], f"Distances test failed: {minDistances}"
+    assert reconstructPath(previousNodes, start, 3) == [0, 1, 2, 3]
+    assert reconstructPath(previousNodes, start, 5) == []
+
+    # Distances that could exceed int64 are rejected instead of wrapping around (or of leaving the
+    # vertex unreached, for weights that never beat the sentinel), and so are non-int weights
+    invalidCases = [([[[1, 2 ** 62]], [[2, 2 ** 62]], []], OverflowError), ([[[1, 2 ** 64]], []], OverflowError),
+                    ([[[1, 2 ** 64 - 1]], []], OverflowError), ([[[1, 2.5]], []], TypeError)]
+    for engine in [dijkstrasAlgorithm, dijkstrasAlgorithmWithPaths]:
+        for invalidEdges, error in invalidCases:
+            try:
+                engine(start, invalidEdges, integerWeights=True)
+            except error:
+                continue
+            raise AssertionError(f"{engine.__name__} accepted {invalidEdges} without {error.__name__}")
+
+        # Only non-int weights are reported as such; a malformed adjacency list keeps its own TypeError
+        for invalidEdges, relabelled in [([[[1, 2.5]], []], True), ([[None], []], False)]:
+            try:
+                engine(start, invalidEdges, integerWeights=True)
+            except TypeError as error:
+                assert ("integerWeights" in str(error)) == relabelled, f"{engine.__name__}: {error}"
+                continue
+            raise AssertionError(f"{engine.__name__} accepted {invalidEdges} without TypeError")
+
+    print("Integer mode tests passed!")
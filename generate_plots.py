@@ -53,6 +53,8 @@ def generate_plots(summary_df: pd.DataFrame):
     fig_co2.tight_layout()
     fig_co2.savefig("co2_emission_comparison.png")
 
-summary = pd.read_csv('dijkstra_experiment_summary.csv')
+if __name__ == '__main__':
+    import sys
 
-generate_plots(summary)
\ No newline at end of file
+    summary = pd.read_csv(sys.argv[1] if len(sys.argv) > 1 else 'dijkstra_experiment_summary.csv')
+    generate_plots(summary)
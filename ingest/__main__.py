@@ -0,0 +1,48 @@
+"""
+Fast edge-list ingestion.
+
+Usage:
+    python -m ingest load grafos/gnp_100000_0.0001.edgelist [--directed] [--format text|csv|binary]
+    python -m ingest convert grafos/gnp_100000_0.0001.edgelist grafos/gnp_100000_0.0001.bin
+"""
+import argparse
+import time
+
+from ingest.edgelist import loadAdjacencyList, readEdgeChunks, writeBinaryEdgeList
+
+FORMATS = ["text", "csv", "binary"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ingest", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    load = subparsers.add_parser("load", help="load an edge list into an adjacency list and report throughput")
+    load.add_argument("edgeList", help="edge list file")
+    load.add_argument("--directed", action="store_true", help="one arc per line instead of an undirected edge")
+    load.add_argument("--format", choices=FORMATS, help="file format (default: from the file extension)")
+
+    convert = subparsers.add_parser("convert", help="convert a text or CSV edge list to the binary format")
+    convert.add_argument("edgeList", help="text or CSV edge list")
+    convert.add_argument("output", help="binary edge list to write")
+    convert.add_argument("--format", choices=FORMATS, help="input format (default: from the file extension)")
+    convert.add_argument("--float-weights", action="store_true", help="store weights as float64 instead of int32")
+    args = parser.parse_args(argv)
+
+    if args.command == "load":
+        edges, stats = loadAdjacencyList(args.edgeList, directed=args.directed, fileFormat=args.format)
+        print(f"{len(edges)} vertices, {stats['edges']} edges, {stats['bytes'] / 2 ** 20:.1f} MiB "
+              f"in {stats['seconds']:.2f} s ({stats['edgesPerSecond']:,.0f} edges/s)")
+        return
+
+    startedAt = time.perf_counter()
+    chunks = readEdgeChunks(args.edgeList, fileFormat=args.format)
+    numberOfEdges = writeBinaryEdgeList(args.output, chunks, floatWeights=args.float_weights)
+    seconds = time.perf_counter() - startedAt
+    print(f"{numberOfEdges} edges written to {args.output} in {seconds:.2f} s "
+          f"({numberOfEdges / max(seconds, 1e-9):,.0f} edges/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+import gc
+import os
+import time
+import warnings
+
+import numpy as np
+
+# Binary edge list: a 32-byte header followed by fixed-size (source, destination, weight) records.
+BINARY_MAGIC = b"DJKEDGE1"
+BINARY_EXTENSIONS = (".bin", ".edgebin")
+_HEADER = np.dtype([("magic", "S8"), ("flags", "<u8"), ("numberOfVertices", "<i8"), ("numberOfEdges", "<i8")])
+_FLAG_FLOAT_WEIGHTS = 1
+
+
+def _recordDtype(floatWeights):
+    return np.dtype([("source", "<i4"), ("destination", "<i4"), ("weight", "<f8" if floatWeights else "<i4")])
+
+
+def _checkColumns(block, numberOfColumns):
+    """
+    Raises ValueError unless every non-blank line of the block has exactly numberOfColumns tokens
+    (vectorized: token starts are counted per line with np.add.reduceat).
+    """
+    data = np.frombuffer(block, dtype=np.uint8)
+    space = data <= ord(" ")
+    tokenStarts = ~space
+    tokenStarts[1:] &= space[:-1]
+    lineStarts = np.flatnonzero(data == ord("\n")) + 1
+    lineStarts = np.concatenate([[0], lineStarts[lineStarts < len(data)]])
+    tokensPerLine = np.add.reduceat(tokenStarts, lineStarts, dtype=np.int32)
+    badLines = np.flatnonzero((tokensPerLine != 0) & (tokensPerLine != numberOfColumns))
+    if len(badLines):
+        first = lineStarts[badLines[0]]
+        line = block[first:block.find(b"\n", first) % (len(block) + 1)]
+        raise ValueError(f"Expected {numberOfColumns} columns on every line like the first one, "
+                         f"got {tokensPerLine[badLines[0]]}: {line[:80]!r}")
+
+
+def _parseTextBlock(block, delimiter, numberOfColumns=None):
+    """
+    Parses a block of complete "source destination [weight]" lines with NumPy. Every line must have
+    numberOfColumns tokens (by default, as many as the block's first line).
+
+    Returns:
+        tuple: ((sources, destinations, weights) arrays or None if the block has no edges,
+               numberOfColumns).
+    """
+    if b"#" in block:
+        block = b"\n".join(line for line in block.split(b"\n") if not line.lstrip().startswith(b"#"))
+    if delimiter is not None:
+        block = block.replace(delimiter, b" ")
+    firstLine = block.lstrip().split(b"\n", 1)[0]
+    if not firstLine:
+        return None, numberOfColumns
+    if numberOfColumns is None:
+        numberOfColumns = len(firstLine.split())
+    if numberOfColumns not in (2, 3):
+        raise ValueError(f"Expected 2 or 3 columns per edge, got {numberOfColumns}: {firstLine[:80]!r}")
+
+    with warnings.catch_warnings():
+        # NumPy only warns when it stops parsing early; treat that as malformed input.
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(block, dtype=np.float64, sep=" ")
+        except DeprecationWarning:
+            raise ValueError(f"Malformed edge list near {firstLine[:80]!r}") from None
+    _checkColumns(block, numberOfColumns)
+
+    values = values.reshape(-1, numberOfColumns)
+    vertices = values[:, :2]
+    badRows = np.flatnonzero(np.any((vertices != np.floor(vertices)) | (vertices < 0), axis=1))
+    if len(badRows):
+        raise ValueError(f"Vertex IDs must be non-negative integers, got {vertices[badRows[0]].tolist()}")
+    weights = values[:, 2] if numberOfColumns == 3 else np.ones(len(values))
+    if np.all(weights == np.floor(weights)):
+        weights = weights.astype(np.int64)
+    return (values[:, 0].astype(np.int64), values[:, 1].astype(np.int64), weights), numberOfColumns
+
+
+def _isNumericLine(line):
+    try:
+        [float(token) for token in line.split()]
+    except ValueError:
+        return False
+    return True
+
+
+def _textChunks(path, chunkBytes, delimiter):
+    with open(path, "rb") as file:
+        remainder = b""
+        firstBlock = True
+        numberOfColumns = None
+        while True:
+            data = file.read(chunkBytes)
+            block = remainder + data
+            if not data:
+                remainder = b""
+            else:
+                cut = block.rfind(b"\n") + 1
+                if cut == 0:
+                    remainder = block
+                    continue
+                block, remainder = block[:cut], block[cut:]
+
+            if firstBlock:
+                firstBlock = False
+                # Skip a CSV-style header such as "source,target,weight": a first line that is not numeric.
+                firstLine, _, rest = block.lstrip().partition(b"\n")
+                if not _isNumericLine(firstLine.replace(b",", b" ")):
+                    block = rest
+
+            # The first edge line fixes the number of columns for the whole file.
+            chunk, numberOfColumns = _parseTextBlock(block, delimiter, numberOfColumns)
+            if chunk is not None:
+                yield chunk
+            if not data:
+                return
+
+
+def _binaryChunks(path, chunkBytes):
+    with open(path, "rb") as file:
+        header = np.fromfile(file, dtype=_HEADER, count=1)
+        if len(header) == 0 or header["magic"][0] != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a binary edge list")
+        record = _recordDtype(bool(header["flags"][0] & _FLAG_FLOAT_WEIGHTS))
+        count = max(1, chunkBytes // record.itemsize)
+        while True:
+            records = np.fromfile(file, dtype=record, count=count)
+            if len(records) == 0:
+                return
+            yield (records["source"].astype(np.int64), records["destination"].astype(np.int64),
+                   records["weight"] if record["weight"].kind == "f" else records["weight"].astype(np.int64))
+
+
+def detectFormat(path):
+    """
+    Guesses the edge list format from the file name: "binary", "csv" or "text" (whitespace separated).
+    """
+    if path.endswith(BINARY_EXTENSIONS):
+        return "binary"
+    if path.endswith(".csv"):
+        return "csv"
+    return "text"
+
+
+def readEdgeChunks(path, fileFormat=None, chunkBytes=64 * 2 ** 20):
+    """
+    Streams an edge list from disk in chunks parsed with NumPy.
+
+    Args:
+        path (str): Edge list file. Text files have one "source destination [weight]" edge per line
+                    (whitespace or comma separated, "#" comments and a CSV header allowed).
+        fileFormat (str): "text", "csv" or "binary". Defaults to `detectFormat(path)`.
+        chunkBytes (int): Approximate number of bytes parsed per chunk.
+
+    Yields:
+        tuple: (sources, destinations, weights) int64 arrays (weights are float64 if not integral).
+    """
+    fileFormat = fileFormat or detectFormat(path)
+    if fileFormat == "binary":
+        return _binaryChunks(path, chunkBytes)
+    if fileFormat in ("text", "csv"):
+        return _textChunks(path, chunkBytes, b"," if fileFormat == "csv" else None)
+    raise ValueError(f"Unknown edge list format {fileFormat!r} (use 'text', 'csv' or 'binary')")
+
+
+def writeBinaryEdgeList(path, chunks, floatWeights=False):
+    """
+    Streams (sources, destinations, weights) chunks into a binary edge list.
+
+    Vertex IDs are stored as int32 and weights as int32, or float64 with floatWeights=True; IDs or
+    weights that do not fit, and negative ones, raise ValueError. The header (number of vertices and
+    edges) is written once all chunks have been consumed.
+
+    Returns:
+        int: The number of edges written.
+    """
+    record = _recordDtype(floatWeights)
+    header = np.zeros(1, dtype=_HEADER)
+    header["magic"] = BINARY_MAGIC
+    header["flags"] = _FLAG_FLOAT_WEIGHTS if floatWeights else 0
+
+    with open(path, "wb") as file:
+        header.tofile(file)
+        for sources, destinations, weights in chunks:
+            if len(sources) == 0:
+                continue
+            if not floatWeights and weights.dtype.kind == "f":
+                raise ValueError("Non-integral weights need floatWeights=True")
+            if max(sources.max(), destinations.max()) > np.iinfo(np.int32).max:
+                raise ValueError("Vertex IDs do not fit the binary format (int32)")
+            if min(sources.min(), destinations.min()) < 0:
+                raise ValueError("Vertex IDs must be non-negative")
+            if weights.min() < 0:
+                raise ValueError("Weights must be non-negative")
+            if not floatWeights and weights.max() > np.iinfo(np.int32).max:
+                raise ValueError("Weights do not fit the binary format (int32), use floatWeights=True")
+            records = np.empty(len(sources), dtype=record)
+            records["source"], records["destination"], records["weight"] = sources, destinations, weights
+            records.tofile(file)
+            header["numberOfEdges"] += len(sources)
+            header["numberOfVertices"] = max(int(header["numberOfVertices"][0]),
+                                             int(max(sources.max(), destinations.max())) + 1)
+        file.seek(0)
+        header.tofile(file)
+    return int(header["numberOfEdges"][0])
+
+
+def loadAdjacencyList(path, directed=False, numberOfVertices=None, fileFormat=None, chunkBytes=64 * 2 ** 20):
+    """
+    Loads an edge list file straight into the adjacency list used by the engines, without networkx.
+
+    Args:
+        path (str): Edge list file (see `readEdgeChunks`).
+        directed (bool): Treat each edge as a single arc instead of adding both directions.
+        numberOfVertices (int): Number of vertices. Defaults to the largest vertex ID + 1.
+        fileFormat (str): "text", "csv" or "binary". Defaults to `detectFormat(path)`.
+        chunkBytes (int): Approximate number of bytes parsed per chunk.
+
+    Returns:
+        tuple: (edges, stats) where edges is a list of [destination, weight] lists per vertex and stats
+               is a dict with "edges", "bytes", "seconds" and "edgesPerSecond".
+    """
+    startedAt = time.perf_counter()
+    tails, heads, costs = [], [], []
+    for sources, destinations, weights in readEdgeChunks(path, fileFormat, chunkBytes):
+        if directed:
+            tails.append(sources), heads.append(destinations), costs.append(weights)
+        else:
+            # Interleave both directions so each vertex lists its arcs in file order.
+            tails.append(np.column_stack((sources, destinations)).ravel())
+            heads.append(np.column_stack((destinations, sources)).ravel())
+            costs.append(np.repeat(weights, 2))
+
+    tails = np.concatenate(tails) if tails else np.zeros(0, dtype=np.int64)
+    heads = np.concatenate(heads) if heads else np.zeros(0, dtype=np.int64)
+    costs = np.concatenate(costs) if costs else np.zeros(0, dtype=np.int64)
+    numberOfEdges = len(tails) if directed else len(tails) // 2
+
+    largestId = int(max(tails.max(), heads.max())) if len(tails) else -1
+    if numberOfVertices is None:
+        numberOfVertices = largestId + 1
+    elif largestId >= numberOfVertices:
+        raise ValueError(f"Vertex {largestId} out of range for {numberOfVertices} vertices")
+    if len(tails) and min(tails.min(), heads.min()) < 0:
+        raise ValueError("Vertex IDs must be non-negative")
+
+    # Group the arcs by tail (CSR) and slice one flat list of [destination, weight] pairs per vertex.
+    byTail = np.argsort(tails, kind="stable")
+    offsets = np.zeros(numberOfVertices + 1, dtype=np.int64)
+    np.cumsum(np.bincount(tails, minlength=numberOfVertices), out=offsets[1:])
+    # Millions of small lists would trigger repeated full garbage collections; none of them can form cycles.
+    gcWasEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        pairs = list(map(list, zip(heads[byTail].tolist(), costs[byTail].tolist())))
+        offsets = offsets.tolist()
+        edges = [pairs[offsets[vertex]:offsets[vertex + 1]] for vertex in range(numberOfVertices)]
+    finally:
+        if gcWasEnabled:
+            gc.enable()
+
+    seconds = time.perf_counter() - startedAt
+    stats = {
+        "edges": numberOfEdges,
+        "bytes": os.path.getsize(path),
+        "seconds": seconds,
+        "edgesPerSecond": numberOfEdges / seconds if seconds > 0 else float("inf"),
+    }
+    return edges, stats
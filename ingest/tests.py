@@ -0,0 +1,116 @@
+import random
+
+import numpy as np
+import pytest
+
+from ingest.edgelist import loadAdjacencyList, readEdgeChunks, writeBinaryEdgeList
+
+
+def _randomArcs(seed, numberOfVertices=300, numberOfEdges=2000):
+    rng = random.Random(seed)
+    return [(rng.randrange(numberOfVertices), rng.randrange(numberOfVertices), rng.randint(1, 20))
+            for _ in range(numberOfEdges)]
+
+
+def _expectedAdjacencyList(arcs, directed):
+    edges = [[] for _ in range(max(max(u, v) for u, v, _ in arcs) + 1)]
+    for u, v, weight in arcs:
+        edges[u].append([v, weight])
+        if not directed:
+            edges[v].append([u, weight])
+    return edges
+
+
+def test_textEdgeListInSmallChunks(tmp_path):
+    """
+    A whitespace edge list read in chunks that cut lines in half gives the same adjacency list as
+    appending the edges one by one, both directed and undirected.
+    """
+    arcs = _randomArcs(0)
+    path = tmp_path / "graph.edgelist"
+    path.write_text("# generated\n" + "".join(f"{u} {v} {weight}\n" for u, v, weight in arcs))
+
+    for directed in [False, True]:
+        edges, stats = loadAdjacencyList(str(path), directed=directed, chunkBytes=97)
+        assert edges == _expectedAdjacencyList(arcs, directed)
+        assert stats["edges"] == len(arcs) and stats["edgesPerSecond"] > 0
+
+
+def test_csvWithHeaderAndBinaryRoundTrip(tmp_path):
+    """
+    A CSV file with a header and no trailing newline converts to the binary format, and both load to
+    the same adjacency list; weights stay ints.
+    """
+    arcs = _randomArcs(1)
+    csvPath, binaryPath = tmp_path / "graph.csv", tmp_path / "graph.bin"
+    csvPath.write_text("source,target,weight\n" + "\n".join(f"{u},{v},{weight}" for u, v, weight in arcs))
+
+    assert writeBinaryEdgeList(str(binaryPath), readEdgeChunks(str(csvPath), chunkBytes=256)) == len(arcs)
+    expected = _expectedAdjacencyList(arcs, directed=False)
+    for path in [csvPath, binaryPath]:
+        edges, _ = loadAdjacencyList(str(path), chunkBytes=256)
+        assert edges == expected
+        assert all(type(weight) is int for neighbors in edges for _, weight in neighbors)
+
+
+def test_unweightedAndFloatWeights(tmp_path):
+    """
+    Missing weights default to 1, fractional weights are kept as floats, and isolated trailing vertices
+    are created when numberOfVertices is given.
+    """
+    path = tmp_path / "graph.txt"
+    path.write_text("0 1\n1 2\n")
+    edges, _ = loadAdjacencyList(str(path), numberOfVertices=4)
+    assert edges == [[[1, 1]], [[0, 1], [2, 1]], [[1, 1]], []]
+
+    path.write_text("0 1 0.5\n")
+    edges, _ = loadAdjacencyList(str(path), directed=True)
+    assert edges == [[[1, 0.5]], []]
+
+
+def test_malformedInputIsRejected(tmp_path):
+    path = tmp_path / "graph.txt"
+    for content in ["0 1 2\n1 x 3\n", "0 1 2 3\n", "0 1 2\n1 2\n", "0 1 5\n1 2\n3 4\n5 6\n",
+                    "0 1\n\n2 3 4 5\n6 7\n", "0 1 2\n1.7 2 3\n", "0 -1 2\n"]:
+        path.write_text(content)
+        with pytest.raises(ValueError):
+            loadAdjacencyList(str(path))
+
+    # The first line fixes the column count across chunks and for a last line without "\n".
+    path.write_text("0 1 2\n1 2 3\n3 4")
+    with pytest.raises(ValueError):
+        loadAdjacencyList(str(path))
+    path.write_text("0 1 2\n" * 50 + "1 2\n" * 50)
+    with pytest.raises(ValueError):
+        list(readEdgeChunks(str(path), chunkBytes=64))
+
+    path.write_text("0 5 1\n")
+    with pytest.raises(ValueError):
+        loadAdjacencyList(str(path), numberOfVertices=3)
+
+
+def test_binaryWriterRejectsValuesOutsideItsFields(tmp_path):
+    """
+    Weights that do not fit the int32 field, and negative weights or vertex IDs, are rejected instead
+    of being silently wrapped.
+    """
+    path = str(tmp_path / "graph.bin")
+    for sources, destinations, weights in [([0], [1], [3000000000]), ([0], [1], [-2]), ([-1], [1], [2])]:
+        chunk = (np.array(sources), np.array(destinations), np.array(weights))
+        with pytest.raises(ValueError):
+            writeBinaryEdgeList(path, [chunk])
+
+    chunk = (np.array([0]), np.array([1]), np.array([3000000000.0]))
+    writeBinaryEdgeList(path, [chunk], floatWeights=True)
+    assert loadAdjacencyList(path, directed=True)[0] == [[[1, 3000000000.0]], []]
+
+
+def test_firstLineIsOnlySkippedWhenNotNumeric(tmp_path):
+    path = tmp_path / "graph.txt"
+    path.write_text("1e0 2 3\n0 1 4\n")
+    edges, _ = loadAdjacencyList(str(path), directed=True)
+    assert edges == [[[1, 4]], [[2, 3]], []]
+
+    path.write_text("from to weight\n0 1 4\n")
+    edges, _ = loadAdjacencyList(str(path), directed=True)
+    assert edges == [[[1, 4]], []]
@@ -0,0 +1,56 @@
+from array import array
+from contextlib import contextmanager
+
+# Integer-distance helpers shared by the `dijkstra` and `mindijkstra` engines (standard library only).
+
+# Distance of unreached vertices in the integer mode of the engines: every bit set. It compares greater
+# than any real distance, and stored as an unsigned 64-bit integer its bytes read as signed int64 are -1,
+# the engines' "unreachable" marker, so `toSignedList` replaces it in C rather than in a Python loop.
+UNREACHED = 2 ** 64 - 1
+
+
+def toSignedList(distances):
+    """
+    Converts a list of int distances to a new list, reading UNREACHED as -1: the list is packed into an
+    array("Q") and read back as int64, so every step runs in C.
+
+    Raises:
+        OverflowError: If a distance is negative or does not fit in a signed 64-bit integer (it would
+                       read as a negative number below -1).
+        TypeError: If a distance is not an int.
+    """
+    signedDistances = memoryview(array("Q", distances)).cast("B").cast("q").tolist()
+    if signedDistances and min(signedDistances) < -1:
+        raise OverflowError("distance beyond the int64 range")
+    return signedDistances
+
+
+def _hasNonIntWeight(edges):
+    """
+    Tells whether some [destination, weight] pair of the adjacency list has a weight that is not an
+    int; False for a malformed list, whose own error is then left alone.
+    """
+    try:
+        return any(not isinstance(weight, int) for arcs in edges for _, weight in arcs)
+    except (TypeError, ValueError):
+        return False
+
+
+@contextmanager
+def integerDistanceErrors(edges):
+    """
+    Re-raises the errors of an integer-mode run on `edges` with a message that names the cause:
+    TypeError when a weight is not an int (from the int64 heap keys, the sums or `toSignedList`),
+    OverflowError for a distance outside [0, 2 ** 63) (from the engines' relaxation check, the heap keys
+    or `toSignedList`). Other TypeErrors, such as a malformed adjacency list, propagate unchanged.
+    """
+    try:
+        yield
+    except TypeError as error:
+        if not _hasNonIntWeight(edges):
+            raise
+        raise TypeError("integerWeights needs int weights; run the engine without integerWeights "
+                        "for float weights") from error
+    except OverflowError as error:
+        raise OverflowError("Shortest path distances must be non-negative and fit in int64; "
+                            "run the engine without integerWeights") from error
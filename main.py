@@ -1,19 +1,78 @@
+from __future__ import annotations
+
+import os
 import time
 import random
 import warnings
-import networkx as nx
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import scipy.stats as st
-from codecarbon import OfflineEmissionsTracker
+from typing import TYPE_CHECKING
 
 from dijkstra.dijkstra_alg import dijkstrasAlgorithm
+from mindijkstra.arrayheap import ArrayMinHeap
 from mindijkstra.mindijkstra_alg import minHeapDijkstrasAlgorithm
 
+# networkx, numpy, pandas, matplotlib, scipy e codecarbon são importados apenas
+# dentro das funções que os usam, para que importar este módulo (ou `cli.py`)
+# e iniciar processos trabalhadores seja rápido.
+if TYPE_CHECKING:
+    import networkx as nx
+    import pandas as pd
+
 # Ignorar warnings para manter a saída limpa
 warnings.filterwarnings('ignore', category=UserWarning)
 
+def minHeapDijkstrasAlgorithmArray(start, edges):
+    """Dijkstra com Min-Heap usando a heap baseada em arrays (`ArrayMinHeap`)."""
+    return minHeapDijkstrasAlgorithm(start, edges, heapClass=ArrayMinHeap)
+
+def dijkstrasAlgorithmInt(start, edges):
+    """Dijkstra clássico com distâncias inteiras (sentinela inteiro, sem `float("inf")`)."""
+    return dijkstrasAlgorithm(start, edges, integerWeights=True)
+
+def minHeapDijkstrasAlgorithmArrayInt(start, edges):
+    """Dijkstra com `ArrayMinHeap` e distâncias inteiras (chaves int64, sem `float("inf")`)."""
+    return minHeapDijkstrasAlgorithm(start, edges, heapClass=ArrayMinHeap, integerWeights=True)
+
+def networkxDijkstra(graph, start):
+    """Referência: `nx.single_source_dijkstra` (networkx importado sob demanda)."""
+    import networkx as nx
+    return nx.single_source_dijkstra(graph, start)
+
+# Algoritmos disponíveis: chave usada na linha de comando -> (nome exibido, função)
+ALGORITHMS = {
+    "classic": ("Dijkstra Clássico", dijkstrasAlgorithm),
+    "minheap": ("Dijkstra com Min-Heap", minHeapDijkstrasAlgorithm),
+    "minheap-array": ("Dijkstra com Min-Heap (array)", minHeapDijkstrasAlgorithmArray),
+    "classic-int": ("Dijkstra Clássico (inteiros)", dijkstrasAlgorithmInt),
+    "minheap-array-int": ("Dijkstra com Min-Heap (array, inteiros)", minHeapDijkstrasAlgorithmArrayInt),
+    "networkx": ("NetworkX Dijkstra", networkxDijkstra),
+}
+DEFAULT_ALGORITHMS = ["classic", "minheap", "networkx"]
+
+TOPOLOGIES = ["gnp", "ba"]
+# Densidades padrão de cada topologia: p = 1 (grafo completo, como a versão original) e m = 2
+DEFAULT_DENSITIES = {"gnp": [1.0], "ba": [2]}
+
+def check_density(topology: str, density, nodes_number: int = None):
+    """
+    Valida a densidade de uma topologia e a devolve normalizada: a probabilidade
+    `p` em (0, 1] para `gnp` e o inteiro `m` >= 1 (menor que o número de nós)
+    para `ba`.
+
+    Raises:
+        ValueError: Se a topologia for desconhecida ou a densidade inválida para ela.
+    """
+    if topology == "gnp":
+        if not 0 < density <= 1:
+            raise ValueError(f"p do gnp deve estar em (0, 1], recebido {density}")
+        return float(density)
+    if topology == "ba":
+        if float(density) != int(density) or density < 1:
+            raise ValueError(f"m do ba deve ser um inteiro >= 1, recebido {density}")
+        if nodes_number is not None and int(density) >= nodes_number:
+            raise ValueError(f"m do ba deve ser menor que o número de nós ({nodes_number}), recebido {density}")
+        return int(density)
+    raise ValueError(f"Topologia desconhecida: {topology!r} (use uma de {TOPOLOGIES})")
+
 def convert_nx_to_adj_list(G: nx.Graph):
     """
     Converte um grafo networkx para o formato de lista de adjacências
@@ -28,122 +87,289 @@ def convert_nx_to_adj_list(G: nx.Graph):
         adj_list[v].append([u, weight])
     return adj_list
 
-def generate_connected_weighted_graph(nodes_number: int):
-    """Gera um grafo ponderado e conectado de forma eficiente."""
-    #G = nx.barabasi_albert_graph(nodes_number, 2, seed=42)
-    G = nx.gnp_random_graph(nodes_number, 2, 42)
+def generate_connected_weighted_graph(
+    nodes_number: int,
+    topology: str = "gnp",
+    density: float = 1.0,
+    seed: int = 42,
+    max_weight: int = 20,
+):
+    """
+    Gera um grafo ponderado e conectado de forma eficiente.
+
+    `density` é a probabilidade `p` de cada aresta para `gnp` e o número `m`
+    de arestas por novo nó para `ba` (Barabási–Albert). Quando o grafo gerado
+    não é conexo, apenas o componente gigante é mantido (com os nós renumerados
+    de 0 a n - 1). Densidades inválidas geram `ValueError` (ver `check_density`).
+    """
+    import networkx as nx
+
+    rng = random.Random(seed)
+    density = check_density(topology, density, nodes_number)
+    if topology == "gnp":
+        G = nx.gnp_random_graph(nodes_number, density, seed)
+    else:
+        G = nx.barabasi_albert_graph(nodes_number, density, seed=seed)
+
+    if G.number_of_nodes() > 0 and not nx.is_connected(G):
+        giant = max(nx.connected_components(G), key=len)
+        G = nx.convert_node_labels_to_integers(G.subgraph(giant).copy())
+
     for (u, v) in G.edges():
-        G.edges[u, v]['weight'] = random.randint(1, 20)
+        G.edges[u, v]['weight'] = rng.randint(1, max_weight)
     return G
 
-def run_dijkstra_versions(graph, adj_list, source_nodes):
+def run_dijkstra_versions(graph, adj_list, source_nodes, algorithms=None, measure_co2=True, rank=None,
+                          measure_memory=False):
     """
-    Executa as três versões de Dijkstra para um conjunto de nós de origem.
+    Executa as versões de Dijkstra escolhidas para um conjunto de nós de origem.
     Agora aceita o grafo em dois formatos diferentes.
+
+    Se `adj_list` foi reordenada (ver `reorder.orders.ReorderedGraph`), `rank`
+    converte os nós de origem para a numeração da lista de adjacências.
+    Com `measure_memory`, registra também o pico de memória alocada (tracemalloc)
+    em uma execução extra a partir da primeira origem, fora da medição de tempo.
     """
     results = []
-    algorithms = {
-        "Dijkstra Clássico": dijkstrasAlgorithm,
-        "Dijkstra com Min-Heap": minHeapDijkstrasAlgorithm,
-        "NetworkX Dijkstra": nx.single_source_dijkstra,
-    }
-
-    for name, func in algorithms.items():
-        tracker = OfflineEmissionsTracker(country_iso_code="BRA", log_level='error')
-        tracker.start()
-        
-        start_time = time.time()
+    if algorithms is None:
+        algorithms = DEFAULT_ALGORITHMS
+
+    if measure_co2:
+        from codecarbon import OfflineEmissionsTracker
+
+    for key in algorithms:
+        name, func = ALGORITHMS[key]
+        if measure_co2:
+            tracker = OfflineEmissionsTracker(country_iso_code="BRA", log_level='error')
+            tracker.start()
+
+        start_time = time.perf_counter()
         for node in source_nodes:
             # Condicional para chamar cada função com os argumentos e formato corretos
-            if "NetworkX" in name:
+            if key == "networkx":
                 func(graph, node)
             else:
                 # Chama sua função com (start, edges) na ordem correta
-                func(node, adj_list)
-        end_time = time.time()
-        
-        emissions_data = tracker.stop()
+                func(node if rank is None else rank[node], adj_list)
+        end_time = time.perf_counter()
+
+        emissions_data = tracker.stop() if measure_co2 else None
 
-        results.append({
+        result = {
             "Algorithm": name,
             "Time (s)": end_time - start_time,
             "CO2 Emission (kg)": emissions_data if emissions_data else 0
-        })
+        }
+        if measure_memory:
+            # O tracemalloc deixa as alocações mais lentas, por isso fica fora da medição de tempo
+            import tracemalloc
+
+            node = source_nodes[0]
+            tracemalloc.start()
+            if key == "networkx":
+                func(graph, node)
+            else:
+                func(node if rank is None else rank[node], adj_list)
+            result["Peak Memory (MiB)"] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            tracemalloc.stop()
+        results.append(result)
+    return results
+
+def run_configuration(config: dict) -> list:
+    """
+    Executa todas as repetições para um único grafo (tamanho, topologia, densidade).
+    Função de nível de módulo para poder ser enviada a processos trabalhadores.
+    """
+    nodes_number = config['nodes']
+    graph = generate_connected_weighted_graph(
+        nodes_number, config['topology'], config['density'], config['seed'])
+    # Converte o grafo para o formato de lista de adjacências uma vez por tamanho
+    adj_list_for_custom_func = convert_nx_to_adj_list(graph)
+    rank = None
+    if config.get('reorder', 'none') != 'none':
+        # Reordena os vértices para melhorar a localidade (pré-processamento fora da medição)
+        from reorder.orders import ReorderedGraph
+
+        reordered = ReorderedGraph(adj_list_for_custom_func, config['reorder'])
+        adj_list_for_custom_func, rank = reordered.edges, reordered.rank
+    rng = random.Random(config['seed'])
+    sources = min(config['sources'], graph.number_of_nodes())
+
+    results = []
+    for i in range(config['repetitions']):
+        if config['verbose']:
+            print(f"  [{config['topology']} n={nodes_number} d={config['density']}] "
+                  f"Repetição {i + 1}/{config['repetitions']}...")
+        source_nodes = rng.sample(list(graph.nodes), sources)
+        # Passa ambos os formatos de grafo para a função de teste
+        run_results = run_dijkstra_versions(
+            graph, adj_list_for_custom_func, source_nodes,
+            config['algorithms'], config['measure_co2'], rank, config.get('measure_memory', False))
+
+        for result in run_results:
+            result['Topology'] = config['topology']
+            result['Density'] = config['density']
+            result['Nodes'] = nodes_number
+            result['Repetition'] = i + 1
+            result['Seed'] = config['seed']
+            result['Reorder'] = config.get('reorder', 'none')
+            results.append(result)
     return results
 
 def run_experiment(
     times: int = 20,
-    node_sizes: list = [100, 500, 1000, 2500, 5000, 10000]
-) -> None:
+    node_sizes: list = [100, 500, 1000, 2500, 5000, 10000],
+    topologies: list = ["gnp"],
+    densities: dict = None,
+    algorithms: list = None,
+    sources: int = 5,
+    seed: int = 42,
+    workers: int = 1,
+    measure_co2: bool = True,
+    measure_memory: bool = False,
+    output_dir: str = ".",
+    plots: bool = True,
+    reorder: str = "none",
+) -> pd.DataFrame:
     """
     Executa o experimento comparativo com diferentes versões do algoritmo de Dijkstra.
+
+    Cada combinação (topologia, densidade, tamanho) é um grafo independente,
+    com semente derivada de `seed`; `densities` associa cada topologia às suas
+    densidades (p para gnp, m para ba; padrão `DEFAULT_DENSITIES`) e todas são
+    validadas antes de gerar o primeiro grafo; com `workers > 1` as combinações são
+    distribuídas entre processos. `reorder` ("bfs", "rcm" ou "degree")
+    renumera os vértices antes de executar as implementações próprias.
+    `measure_memory` adiciona a coluna "Peak Memory (MiB)".
     """
-    all_results = []
-    
+    import numpy as np
+    import pandas as pd
+
+    random.seed(seed)
+    np.random.seed(seed)
+    if algorithms is None:
+        algorithms = DEFAULT_ALGORITHMS
+    unknown = [topology for topology in topologies if topology not in TOPOLOGIES]
+    if unknown:
+        raise ValueError(f"Topologia desconhecida: {unknown[0]!r} (use uma de {TOPOLOGIES})")
+    densities = {**DEFAULT_DENSITIES, **(densities or {})}
+    graphs = [
+        (t, check_density(t, d, n), n)
+        for t in topologies for d in densities[t] for n in node_sizes
+    ]
+
+    configs = [
+        {
+            'nodes': nodes_number,
+            'topology': topology,
+            'density': density,
+            'seed': seed + idx,
+            'repetitions': times,
+            'sources': sources,
+            'algorithms': algorithms,
+            'measure_co2': measure_co2,
+            'measure_memory': measure_memory,
+            'verbose': workers <= 1,
+            'reorder': reorder,
+        }
+        for idx, (topology, density, nodes_number) in enumerate(graphs)
+    ]
+
     print("Iniciando o experimento...")
+    all_results = []
+    if workers <= 1:
+        for config in configs:
+            print(f"\nProcessando grafos com {config['nodes']} nós "
+                  f"({config['topology']}, densidade {config['density']})...")
+            all_results.extend(run_configuration(config))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
 
-    for nodes_number in node_sizes:
-        print(f"\nProcessando grafos com {nodes_number} nós...")
-        graph = generate_connected_weighted_graph(nodes_number)
-        # Converte o grafo para o formato de lista de adjacências uma vez por tamanho
-        adj_list_for_custom_func = convert_nx_to_adj_list(graph)
-        
-        for i in range(times):
-            print(f"  Repetição {i + 1}/{times}...")
-            source_nodes = random.sample(list(graph.nodes), 5)
-            # Passa ambos os formatos de grafo para a função de teste
-            run_results = run_dijkstra_versions(graph, adj_list_for_custom_func, source_nodes)
-            
-            for result in run_results:
-                result['Nodes'] = nodes_number
-                result['Repetition'] = i + 1
-                all_results.append(result)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for config, results in zip(configs, executor.map(run_configuration, configs)):
+                print(f"Concluído: {config['nodes']} nós ({config['topology']}, densidade {config['density']})")
+                all_results.extend(results)
 
+    os.makedirs(output_dir, exist_ok=True)
     df_results = pd.DataFrame(all_results)
-    df_results.to_csv("dijkstra_experiment_raw_results.csv", index=False)
-    
-    summary = df_results.groupby(['Nodes', 'Algorithm']).agg(
+    df_results.to_csv(os.path.join(output_dir, "dijkstra_experiment_raw_results.csv"), index=False)
+
+    summary = summarize_results(df_results)
+    summary.to_csv(os.path.join(output_dir, "dijkstra_experiment_summary.csv"), index=False)
+    print("\nTabela de resumo salva em 'dijkstra_experiment_summary.csv'")
+
+    if plots:
+        generate_plots(summary, output_dir, measure_co2)
+        if measure_co2:
+            print("Gráficos comparativos salvos em 'execution_time_comparison.png' e 'co2_emission_comparison.png'")
+        else:
+            print("Gráfico comparativo salvo em 'execution_time_comparison.png'")
+    return summary
+
+def summarize_results(df_results: pd.DataFrame) -> pd.DataFrame:
+    """Calcula média, desvio padrão e IC de 95% por (grafo, algoritmo)."""
+    import numpy as np
+    import pandas as pd
+    import scipy.stats as st
+
+    keys = [key for key in ['Topology', 'Density', 'Nodes', 'Algorithm'] if key in df_results]
+    summary = df_results.groupby(keys).agg(
         Mean_Time=('Time (s)', 'mean'),
         Std_Time=('Time (s)', 'std'),
         Mean_CO2=('CO2 Emission (kg)', 'mean'),
-        Std_CO2=('CO2 Emission (kg)', 'std')
+        Std_CO2=('CO2 Emission (kg)', 'std'),
+        Runs=('Time (s)', 'count'),
+        **({'Mean_Memory': ('Peak Memory (MiB)', 'mean'), 'Std_Memory': ('Peak Memory (MiB)', 'std')}
+           if 'Peak Memory (MiB)' in df_results else {}),
     ).reset_index()
 
     def calculate_ci(mean, std, n, confidence=0.95):
         if std == 0 or pd.isna(std): return (mean, mean)
         se = std / np.sqrt(n)
         ci = st.t.interval(confidence, df=n-1, loc=mean, scale=se)
-        return ci
+        return tuple(float(bound) for bound in ci)
 
     summary['Time CI 95%'] = summary.apply(
-        lambda row: calculate_ci(row['Mean_Time'], row['Std_Time'], times), axis=1)
+        lambda row: calculate_ci(row['Mean_Time'], row['Std_Time'], row['Runs']), axis=1)
     summary['CO2 Emission CI 95%'] = summary.apply(
-        lambda row: calculate_ci(row['Mean_CO2'], row['Std_CO2'], times), axis=1)
-                       
-    summary.to_csv("dijkstra_experiment_summary.csv", index=False)
-    print("\nTabela de resumo salva em 'dijkstra_experiment_summary.csv'")
-    
-    generate_plots(summary)
-    print("Gráficos comparativos salvos em 'execution_time_comparison.png' e 'co2_emission_comparison.png'")
+        lambda row: calculate_ci(row['Mean_CO2'], row['Std_CO2'], row['Runs']), axis=1)
+    return summary
+
+def _series(summary_df: pd.DataFrame):
+    """Agrupa o resumo em séries (uma linha por algoritmo e configuração de grafo)."""
+    keys = [key for key in ['Algorithm', 'Topology', 'Density'] if key in summary_df]
+    several_graphs = len(keys) > 1 and len(summary_df.drop_duplicates(keys[1:])) > 1
+    for values, group in summary_df.groupby(keys if several_graphs else ['Algorithm']):
+        if several_graphs:
+            name, topology, density = values
+            yield f"{name} ({topology}, {density})", group.sort_values('Nodes')
+        else:
+            yield values[0], group.sort_values('Nodes')
 
-def generate_plots(summary_df: pd.DataFrame):
+def generate_plots(summary_df: pd.DataFrame, output_dir: str = ".", co2: bool = True):
     """Gera e salva gráficos comparativos a partir do DataFrame de resumo."""
+    import matplotlib.pyplot as plt
+
     plt.style.use('seaborn-v0_8-whitegrid')
-    
+
     fig_time, ax_time = plt.subplots(figsize=(12, 7))
-    for name, group in summary_df.groupby('Algorithm'):
+    for name, group in _series(summary_df):
         ax_time.plot(group['Nodes'], group['Mean_Time'], marker='o', linestyle='-', label=name)
-        
+
     ax_time.set_title('Tempo de Execução Médio vs. Número de Nós', fontsize=16)
     ax_time.set_xlabel('Número de Nós', fontsize=12)
     ax_time.set_ylabel('Tempo de Execução Médio (s)', fontsize=12)
     ax_time.legend()
     ax_time.grid(True, which='both', linestyle='--')
     fig_time.tight_layout()
-    fig_time.savefig("execution_time_comparison.png")
+    fig_time.savefig(os.path.join(output_dir, "execution_time_comparison.png"))
+    plt.close(fig_time)
+
+    if not co2:
+        return
 
     fig_co2, ax_co2 = plt.subplots(figsize=(12, 7))
-    for name, group in summary_df.groupby('Algorithm'):
+    for name, group in _series(summary_df):
         ax_co2.plot(group['Nodes'], group['Mean_CO2'], marker='o', linestyle='-', label=name)
 
     ax_co2.set_title('Emissão Média de CO₂ vs. Número de Nós', fontsize=16)
@@ -152,9 +378,9 @@ def generate_plots(summary_df: pd.DataFrame):
     ax_co2.legend()
     ax_co2.grid(True, which='both', linestyle='--')
     fig_co2.tight_layout()
-    fig_co2.savefig("co2_emission_comparison.png")
+    fig_co2.savefig(os.path.join(output_dir, "co2_emission_comparison.png"))
+    plt.close(fig_co2)
 
 if __name__ == '__main__':
-    node_sizes_to_test = [100,500,1000,5000] 
-    #node_sizes_to_test = [10,100]
-    run_experiment(node_sizes=node_sizes_to_test)
\ No newline at end of file
+    from cli import main
+    main()
@@ -0,0 +1,138 @@
+from array import array
+
+
+class ArrayMinHeap:
+    """
+    ArrayMinHeap class: A drop-in replacement for MinHeap that keeps the heap in flat typed buffers
+    instead of a list of (vertex, distance) tuples.
+
+    Vertex IDs and their keys live in two parallel arrays (`vertices` and `keys`) and a third array
+    (`positions`) maps every vertex to its index in the heap, or -1 if the vertex is not in the heap.
+    The sift loops are inlined and move a "hole" instead of swapping, so `update` and `remove` do not
+    allocate anything besides the (vertex, distance) pair returned by `remove`.
+
+    Unlike MinHeap, the heap starts empty: `update` on a vertex that is not in the heap inserts it,
+    so callers no longer need to prefill the heap with V infinite entries.
+    """
+    __slots__ = ("vertices", "keys", "positions", "size")
+
+    def __init__(self, numberOfVertices, typecode="d"):
+        """
+        Initializes an empty heap able to hold the vertices 0 .. numberOfVertices - 1.
+
+        Args:
+            numberOfVertices (int): Number of vertices in the graph. Vertex IDs must be in
+                                    range(numberOfVertices).
+            typecode (str): Array typecode used for the keys. "d" (default) stores float distances;
+                            "q" stores 64-bit integer distances.
+
+        Attributes:
+            vertices (array): Vertex stored at each heap index.
+            keys (array): Key (distance) stored at each heap index.
+            positions (array): Heap index of each vertex, -1 when the vertex is not in the heap.
+            size (int): Number of entries currently in the heap.
+        """
+        self.vertices = array("q", bytes(8 * numberOfVertices))
+        self.keys = array(typecode, bytes(array(typecode).itemsize * numberOfVertices))
+        self.positions = array("q", [-1]) * numberOfVertices
+        self.size = 0
+
+    def isEmpty(self):
+        """
+        Checks if the heap is empty.
+
+        Returns:
+            bool: True if the heap is empty, False otherwise.
+        """
+        return self.size == 0
+
+    def remove(self):
+        """
+        Removes and returns the smallest element (root) in the heap.
+
+        Returns:
+            tuple: The (vertex, distance) pair with the smallest distance, or None if the heap is empty.
+
+        Complexity:
+            Time: O(log(n))
+            Space: O(1)
+        """
+        size = self.size
+        if size == 0:
+            return None
+
+        vertices = self.vertices
+        keys = self.keys
+        positions = self.positions
+
+        vertex = vertices[0]
+        distance = keys[0]
+        positions[vertex] = -1
+
+        size -= 1
+        self.size = size
+        if size == 0:
+            return vertex, distance
+
+        # Sift the last entry down from the root, moving the hole instead of swapping.
+        lastVertex = vertices[size]
+        lastKey = keys[size]
+        currentIdx = 0
+        childOneIdx = 1
+        while childOneIdx < size:
+            childKey = keys[childOneIdx]
+            childTwoIdx = childOneIdx + 1
+            if childTwoIdx < size and keys[childTwoIdx] < childKey:
+                childOneIdx = childTwoIdx
+                childKey = keys[childTwoIdx]
+            if childKey >= lastKey:
+                break
+            childVertex = vertices[childOneIdx]
+            vertices[currentIdx] = childVertex
+            keys[currentIdx] = childKey
+            positions[childVertex] = currentIdx
+            currentIdx = childOneIdx
+            childOneIdx = currentIdx * 2 + 1
+
+        vertices[currentIdx] = lastVertex
+        keys[currentIdx] = lastKey
+        positions[lastVertex] = currentIdx
+        return vertex, distance
+
+    def update(self, vertex, value):
+        """
+        Decreases the distance of a given vertex and restores the heap property.
+        If the vertex is not in the heap it is inserted.
+
+        Args:
+            vertex (int): The vertex whose distance is to be updated.
+            value (int | float): The new distance value. Must not be greater than the current one.
+
+        Complexity:
+            Time: O(log(n))
+            Space: O(1)
+        """
+        vertices = self.vertices
+        keys = self.keys
+        positions = self.positions
+
+        currentIdx = positions[vertex]
+        if currentIdx < 0:
+            currentIdx = self.size
+            self.size = currentIdx + 1
+
+        # Sift up, moving the hole instead of swapping.
+        while currentIdx > 0:
+            parentIdx = (currentIdx - 1) >> 1
+            parentKey = keys[parentIdx]
+            if value >= parentKey:
+                break
+            parentVertex = vertices[parentIdx]
+            vertices[currentIdx] = parentVertex
+            keys[currentIdx] = parentKey
+            positions[parentVertex] = currentIdx
+            currentIdx = parentIdx
+
+        vertices[currentIdx] = vertex
+        keys[currentIdx] = value
+        positions[vertex] = currentIdx
@@ -1,8 +1,9 @@
+from intdistances import UNREACHED, integerDistanceErrors, toSignedList
 from mindijkstra.minheap import MinHeap
 
 # O((v + e) * log(v)) time | O(v) space — where v is the number
 # of vertices and e is the number of edges in the input graph
-def minHeapDijkstrasAlgorithm(start, edges):
+def minHeapDijkstrasAlgorithm(start, edges, heapClass=MinHeap, integerWeights=False):
     """
     Implements Dijkstra's algorithm to find the shortest paths from a starting vertex to all other vertices
     in a weighted graph. The graph is represented using an adjacency list.
@@ -11,11 +12,17 @@ def minHeapDijkstrasAlgorithm(start, edges):
         start (int): The starting vertex index.
         edges (list of list): An adjacency list where each index represents a vertex, and each entry
                               is a list of [destination, weight] pairs.
+        heapClass (type): Priority queue implementation, `MinHeap` (default) or `ArrayMinHeap`.
+        integerWeights (bool): If True, all weights are non-negative ints and distances are kept as
+                               ints, without float("inf") (see `integerMinHeapDijkstrasAlgorithm`).
 
     Returns:
         list: A list of minimum distances from the starting vertex to each vertex in the graph.
               If a vertex is unreachable, its distance is represented as -1.
     """
+    if integerWeights:
+        return integerMinHeapDijkstrasAlgorithm(start, edges, heapClass)
+
     # Step 1: Initialize the number of vertices in the graph
     numberOfVertices = len(edges)
 
@@ -25,13 +32,19 @@ def minHeapDijkstrasAlgorithm(start, edges):
     minDistances[start] = 0
 
     # Step 3: Initialize the MinHeap to track the vertices and their current shortest distances
-    minDistancesHeap = MinHeap([(idx, float("inf")) for idx in range(numberOfVertices)])
+    # (the array-backed heap starts empty and inserts vertices on their first update)
+    if heapClass is MinHeap:
+        minDistancesHeap = MinHeap([(idx, float("inf")) for idx in range(numberOfVertices)])
+    else:
+        minDistancesHeap = heapClass(numberOfVertices)
     minDistancesHeap.update(start, 0)  # Update the starting vertex's distance to 0
 
     # Step 4: Process vertices until the heap is empty
     while not minDistancesHeap.isEmpty():
-        # Extract the vertex with the smallest known distance
-        vertex, currentMinDistance = minDistancesHeap.remove()
+        # Extract the vertex with the smallest known distance; its exact distance is read from
+        # minDistances, since ArrayMinHeap keeps float64 keys (ints would come back as floats)
+        vertex, _ = minDistancesHeap.remove()
+        currentMinDistance = minDistances[vertex]
 
         # If the current distance is infinity, no further reachable vertices exist
         if currentMinDistance == float("inf"):
@@ -53,6 +66,44 @@ def minHeapDijkstrasAlgorithm(start, edges):
     # Step 6: Convert unreachable vertices' distances from infinity to -1
     return list(map(lambda x: -1 if x == float("inf") else x, minDistances))
 
+def integerMinHeapDijkstrasAlgorithm(start, edges, heapClass=MinHeap):
+    """
+    Integer-distance version of `minHeapDijkstrasAlgorithm` for graphs with non-negative int weights.
+
+    Unreached vertices hold an all-ones int sentinel instead of float("inf"), so every comparison in the
+    loop is between ints, and `ArrayMinHeap` keeps int64 keys. The distances are returned by
+    `toSignedList`, which turns the sentinel into -1 in one pass run in C.
+
+    Raises:
+        OverflowError: If a shortest path distance exceeds the int64 range (weights must fit in int64).
+        TypeError: If a weight is not an int.
+    """
+    numberOfVertices = len(edges)
+
+    minDistances = [UNREACHED] * numberOfVertices
+    minDistances[start] = 0
+    if heapClass is MinHeap:
+        minDistancesHeap = MinHeap([(idx, UNREACHED) for idx in range(numberOfVertices)])
+    else:
+        minDistancesHeap = heapClass(numberOfVertices, "q")
+    minDistancesHeap.update(start, 0)
+
+    with integerDistanceErrors(edges):
+        while not minDistancesHeap.isEmpty():
+            vertex, currentMinDistance = minDistancesHeap.remove()
+            if currentMinDistance == UNREACHED:
+                break
+
+            for destination, distanceToDestination in edges[vertex]:
+                newPathDistance = currentMinDistance + distanceToDestination
+                if newPathDistance < minDistances[destination]:
+                    minDistances[destination] = newPathDistance
+                    minDistancesHeap.update(destination, newPathDistance)
+                elif newPathDistance >= UNREACHED:
+                    raise OverflowError(newPathDistance)
+
+        return toSignedList(minDistances)
+
 start = 0
 edges = [
     [[1, 7]],
@@ -0,0 +1,73 @@
+from mindijkstra.minheap import MinHeap
+
+# O((v + e) * log(v)) time | O(v) space — for any number of sources, instead of
+# k separate runs of O((v + e) * log(v)) each
+def minHeapMultiSourceDijkstrasAlgorithm(sources, edges, heapClass=MinHeap):
+    """
+    Implements a multi-source Dijkstra's algorithm (a virtual super-source joined to every source by a
+    zero-weight edge) to find, for every vertex, the distance to its nearest source and which source
+    that is. The labels partition the graph into the Voronoi cells of the sources.
+
+    Args:
+        sources (list of int): The source (facility) vertex indices.
+        edges (list of list): An adjacency list where each index represents a vertex, and each entry
+                              is a list of [destination, weight] pairs. On a directed graph distances go
+                              from the sources; use `reverseEdges(edges)` for distances to them.
+        heapClass (type): Priority queue implementation, `MinHeap` (default) or `ArrayMinHeap`.
+
+    Returns:
+        tuple: A tuple containing:
+            - minDistances (list): The distance from the nearest source to each vertex, or -1 if no
+                                   source reaches it.
+            - nearestSources (list): The nearest source of each vertex (ties go to the source whose
+                                     path is settled first), or -1 if no source reaches it.
+    """
+    # Step 1: Initialize the distances and labels; every source owns itself at distance 0
+    numberOfVertices = len(edges)
+    minDistances = [float("inf")] * numberOfVertices
+    nearestSources = [-1] * numberOfVertices
+
+    # Step 2: Seed the heap with all sources at distance 0
+    # (the array-backed heap starts empty and inserts vertices on their first update)
+    if heapClass is MinHeap:
+        heap = MinHeap([(idx, float("inf")) for idx in range(numberOfVertices)])
+    else:
+        heap = heapClass(numberOfVertices)
+    for source in sources:
+        if nearestSources[source] == -1:
+            minDistances[source] = 0
+            nearestSources[source] = source
+            heap.update(source, 0)
+
+    # Step 3: Process vertices until the heap is empty
+    while not heap.isEmpty():
+        # The exact distance comes from minDistances (ArrayMinHeap keeps float64 keys)
+        vertex, _ = heap.remove()
+        currentMinDistance = minDistances[vertex]
+
+        # If the current distance is infinity, no further reachable vertices exist
+        if currentMinDistance == float("inf"):
+            break
+
+        # Step 4: Relaxation - a shorter path also hands the destination over to this vertex's source
+        owner = nearestSources[vertex]
+        for destination, weight in edges[vertex]:
+            newPathDistance = currentMinDistance + weight
+            if newPathDistance < minDistances[destination]:
+                minDistances[destination] = newPathDistance
+                nearestSources[destination] = owner
+                heap.update(destination, newPathDistance)
+
+    # Step 5: Convert unreachable vertices' distances from infinity to -1
+    return [-1 if distance == float("inf") else distance for distance in minDistances], nearestSources
+
+def reverseEdges(edges):
+    """
+    Returns the adjacency list of the graph with every arc reversed, so that running an engine from a
+    vertex on it gives the distances *to* that vertex in the original graph.
+    """
+    reversedEdges = [[] for _ in edges]
+    for vertex, neighbors in enumerate(edges):
+        for destination, weight in neighbors:
+            reversedEdges[destination].append([vertex, weight])
+    return reversedEdges
@@ -1,6 +1,7 @@
+from intdistances import UNREACHED, integerDistanceErrors, toSignedList
 from mindijkstra.minheap import MinHeap
 
-def minHeapDijkstrasAlgorithmWithPaths(start, edges):
+def minHeapDijkstrasAlgorithmWithPaths(start, edges, heapClass=MinHeap, integerWeights=False):
     """
     Implements Dijkstra's algorithm to compute the shortest paths from a starting vertex to all other vertices
     in a weighted graph. It also tracks the predecessors of each vertex for path reconstruction.
@@ -9,11 +10,15 @@ def minHeapDijkstrasAlgorithmWithPaths(start, edges):
         start (int): The index of the starting vertex.
         edges (list of list): Adjacency list representation of the graph, where each index represents a vertex,
                               and each entry is a list of [destination, weight] pairs.
+        heapClass (type): Priority queue implementation, `MinHeap` (default) or `ArrayMinHeap`.
+        integerWeights (bool): If True, all weights are non-negative ints and distances are kept as
+                               ints, without float("inf") (see `integerMinHeapDijkstrasAlgorithmWithPaths`).
 
     Returns:
         tuple: A tuple containing:
             - minDistances (list): A list of the shortest distances from the starting vertex to each vertex.
-                                   Vertices that are unreachable will have a distance of `float("inf")`.
+                                   Vertices that are unreachable will have a distance of `float("inf")`
+                                   (-1 with integerWeights).
             - previousNodes (list): A list where each index points to the predecessor of the vertex
                                     in the shortest path. If no path exists, the predecessor is `None`.
 
@@ -24,6 +29,9 @@ def minHeapDijkstrasAlgorithmWithPaths(start, edges):
         4. Track the predecessor of each vertex to allow path reconstruction later.
         5. Return the minimum distances and the list of predecessors.
     """
+    if integerWeights:
+        return integerMinHeapDijkstrasAlgorithmWithPaths(start, edges, heapClass)
+
     numberOfVertices = len(edges)  # Total number of vertices in the graph
 
     # Step 1: Initialize minimum distances and predecessors
@@ -31,24 +39,39 @@ def minHeapDijkstrasAlgorithmWithPaths(start, edges):
     minDistances[start] = 0  # Distance to the start node is 0
 
     previousNodes = [None] * numberOfVertices  # Array to store the predecessor of each vertex
+    visited = [False] * numberOfVertices  # Vertices already removed from the heap
 
     # Step 2: Initialize the MinHeap
-    heap = MinHeap([(i, float("inf")) for i in range(numberOfVertices)])
+    # (the array-backed heap starts empty and inserts vertices on their first update)
+    if heapClass is MinHeap:
+        heap = MinHeap([(i, float("inf")) for i in range(numberOfVertices)])
+    else:
+        heap = heapClass(numberOfVertices)
     heap.update(start, 0)  # Update the distance of the starting vertex to 0
 
     # Step 3: Process vertices until the heap is empty
     while not heap.isEmpty():
-        # Extract the vertex with the smallest known distance
-        vertex, currentMinDistance = heap.remove()
+        # Extract the vertex with the smallest known distance; its exact distance is read from
+        # minDistances, since ArrayMinHeap keeps float64 keys (ints would come back as floats)
+        vertex, _ = heap.remove()
+        currentMinDistance = minDistances[vertex]
+
+        # If the current distance is infinity, no further reachable vertices exist
+        if currentMinDistance == float("inf"):
+            break
 
-        # Ignore outdated distances (e.g., if a shorter distance was already found)
-        if currentMinDistance > minDistances[vertex]:
-            continue
+        # Mark the vertex as finalized: its distance can no longer change
+        visited[vertex] = True
 
         # Step 4: Relaxation - Update distances to neighboring vertices
         for edge in edges[vertex]:
             destination, weight = edge  # Extract destination vertex and edge weight
 
+            # Skip finalized vertices (with zero-weight edges, `<=` below would otherwise
+            # update a vertex that was already removed from the heap)
+            if visited[destination]:
+                continue
+
             # Calculate the new potential distance to the destination vertex
             newPathDistance = currentMinDistance + weight
 
@@ -60,6 +83,53 @@ def minHeapDijkstrasAlgorithmWithPaths(start, edges):
 
     return minDistances, previousNodes
 
+def integerMinHeapDijkstrasAlgorithmWithPaths(start, edges, heapClass=MinHeap):
+    """
+    Integer-distance version of `minHeapDijkstrasAlgorithmWithPaths` for graphs with non-negative int
+    weights, built like `mindijkstra_alg.integerMinHeapDijkstrasAlgorithm`. Unreachable vertices get a
+    distance of -1 and a `None` predecessor.
+
+    Raises:
+        OverflowError: If a shortest path distance exceeds the int64 range (weights must fit in int64).
+        TypeError: If a weight is not an int.
+    """
+    numberOfVertices = len(edges)
+
+    minDistances = [UNREACHED] * numberOfVertices
+    minDistances[start] = 0
+    previousNodes = [None] * numberOfVertices
+    visited = bytearray(numberOfVertices)
+
+    if heapClass is MinHeap:
+        heap = MinHeap([(i, UNREACHED) for i in range(numberOfVertices)])
+    else:
+        heap = heapClass(numberOfVertices, "q")
+    heap.update(start, 0)
+
+    with integerDistanceErrors(edges):
+        while not heap.isEmpty():
+            vertex, currentMinDistance = heap.remove()
+            if currentMinDistance == UNREACHED:
+                break
+            if currentMinDistance > minDistances[vertex]:
+                continue
+            visited[vertex] = True
+
+            for destination, weight in edges[vertex]:
+                if visited[destination]:
+                    continue
+                newPathDistance = currentMinDistance + weight
+                if newPathDistance <= minDistances[destination]:
+                    if newPathDistance == UNREACHED:
+                        raise OverflowError(newPathDistance)
+                    minDistances[destination] = newPathDistance
+                    previousNodes[destination] = vertex
+                    heap.update(destination, newPathDistance)
+                elif newPathDistance >= UNREACHED:
+                    raise OverflowError(newPathDistance)
+
+        return toSignedList(minDistances), previousNodes
+
 def reconstructPath(previousNodes, start, end):
     """
     Reconstructs the shortest path from the start node to the end node using the predecessor list.
@@ -1,5 +1,9 @@
-from mindijsktra.minddijkstra_alg import *
-from mindijsktra.mindijkstra_alg_paths import *
+import random
+
+from mindijkstra.arrayheap import ArrayMinHeap
+from mindijkstra.minheap import MinHeap
+from mindijkstra.mindijkstra_alg import *
+from mindijkstra.mindijkstra_alg_paths import *
 
 def test_dijkstras_algorithm():
     """
@@ -52,9 +56,6 @@ def test_dijkstras_algorithm():
     print("Test passed: Output matches expected result.")
 
 
-# Run the test function
-test_dijkstras_algorithm()
-
 def test_dijkstrasAlgorithmWithPaths():
     """
     Test function for the `dijkstrasAlgorithmWithPaths` function.
@@ -124,5 +125,184 @@ def test_dijkstrasAlgorithmWithPaths():
     print("All tests passed!")
 
 
-# Run the test
-test_dijkstrasAlgorithmWithPaths()
\ No newline at end of file
+def test_arrayMinHeap():
+    """
+    Test function for the `ArrayMinHeap` class.
+
+    Inserts vertices lazily through `update`, decreases some of their keys and checks that `remove`
+    returns every vertex exactly once in non-decreasing order of distance.
+    """
+    rng = random.Random(0)
+    numberOfVertices = 200
+    heap = ArrayMinHeap(numberOfVertices)
+    assert heap.isEmpty()
+
+    expected = {}
+    for vertex in rng.sample(range(numberOfVertices), 150):
+        expected[vertex] = rng.randint(50, 100)
+        heap.update(vertex, expected[vertex])
+    for vertex in rng.sample(sorted(expected), 50):
+        expected[vertex] -= rng.randint(0, 50)
+        heap.update(vertex, expected[vertex])
+
+    removed = []
+    while not heap.isEmpty():
+        removed.append(heap.remove())
+
+    assert heap.remove() is None
+    assert sorted(vertex for vertex, _ in removed) == sorted(expected)
+    assert all(distance == expected[vertex] for vertex, distance in removed)
+    assert [distance for _, distance in removed] == sorted(expected.values())
+
+    print("ArrayMinHeap test passed!")
+
+
+def test_dijkstrasAlgorithmWithArrayMinHeap():
+    """
+    Test function checking that both min-heap engines give the same results with `ArrayMinHeap`
+    as with the default `MinHeap`.
+    """
+    edges = [
+        [[1, 7]],                   # Node 0 -> Node 1 (weight 7)
+        [[2, 6], [3, 20], [4, 3]],  # Node 1 -> Node 2 (6), Node 3 (20), Node 4 (3)
+        [[3, 14]],                  # Node 2 -> Node 3 (weight 14)
+        [[4, 2]],                   # Node 3 -> Node 4 (weight 2)
+        [],                         # Node 4 has no outgoing edges
+        []                          # Node 5 has no outgoing edges
+    ]
+    start = 0
+
+    result = minHeapDijkstrasAlgorithm(start, edges, heapClass=ArrayMinHeap)
+    assert result == [0, 7, 13, 27, 10, -1], f"Test failed: {result}"
+
+    minDistances, previousNodes = minHeapDijkstrasAlgorithmWithPaths(start, edges, heapClass=ArrayMinHeap)
+    assert minDistances == [0, 7, 13, 27, 10, float("inf")], f"Distances test failed: {minDistances}"
+    assert reconstructPath(previousNodes, start, 3) == [0, 1, 2, 3]
+    assert reconstructPath(previousNodes, start, 5) == []
+
+    # Integer weights must come back as exact ints, even past float64 precision (2**53)
+    from mindijkstra.mindijkstra_alg_multisource import minHeapMultiSourceDijkstrasAlgorithm
+    assert all(type(d) is int for d in result), f"Type test failed: {result}"
+    assert all(type(d) is int for d in minDistances[:5]), f"Type test failed: {minDistances}"
+    bigEdges = [[[1, 2**53 + 1]], [[2, 2]], []]
+    assert minHeapDijkstrasAlgorithm(0, bigEdges, heapClass=ArrayMinHeap) == [0, 2**53 + 1, 2**53 + 3]
+    assert minHeapMultiSourceDijkstrasAlgorithm([0], bigEdges, heapClass=ArrayMinHeap)[0] == [0, 2**53 + 1, 2**53 + 3]
+
+    print("ArrayMinHeap engine tests passed!")
+
+
+def test_dijkstrasAlgorithmWithPathsZeroWeightCycle():
+    """
+    Test function checking that the paths engine terminates on a zero-weight cycle with both heaps:
+    with `<=` relaxation, a vertex already removed from the heap must not be updated (re-inserted).
+    """
+    edges = [
+        [[1, 0]],  # Node 0 -> Node 1 (weight 0)
+        [[0, 0]],  # Node 1 -> Node 0 (weight 0)
+        []         # Node 2 is unreachable
+    ]
+
+    for heapClass in (MinHeap, ArrayMinHeap):
+        minDistances, previousNodes = minHeapDijkstrasAlgorithmWithPaths(0, edges, heapClass=heapClass)
+        assert minDistances == [0, 0, float("inf")], f"Distances test failed: {minDistances}"
+        assert previousNodes == [None, 0, None], f"Predecessors test failed: {previousNodes}"
+
+    print("Zero-weight cycle test passed!")
+
+
+def test_multiSourceDijkstrasAlgorithm():
+    """
+    Test function for `minHeapMultiSourceDijkstrasAlgorithm`.
+
+    On random graphs, a single multi-source run must give every vertex the minimum of the distances of
+    separate single-source runs, labelled with a source that attains it, with both heap classes.
+    """
+    from difftest.generators import SMALL_SHAPES, generateCase, toAdjacencyList
+    from mindijkstra.mindijkstra_alg_multisource import minHeapMultiSourceDijkstrasAlgorithm
+
+    rng = random.Random(4)
+    for shape in SMALL_SHAPES:
+        edges = toAdjacencyList(generateCase(rng, shape))
+        sources = rng.sample(range(len(edges)), min(3, len(edges)))
+        perSource = {source: minHeapDijkstrasAlgorithm(source, edges) for source in sources}
+
+        for heapClass in [MinHeap, ArrayMinHeap]:
+            minDistances, nearestSources = minHeapMultiSourceDijkstrasAlgorithm(sources, edges, heapClass)
+            for vertex in range(len(edges)):
+                reachable = [perSource[source][vertex] for source in sources if perSource[source][vertex] != -1]
+                if not reachable:
+                    assert minDistances[vertex] == -1 and nearestSources[vertex] == -1
+                else:
+                    assert minDistances[vertex] == min(reachable)
+                    assert perSource[nearestSources[vertex]][vertex] == minDistances[vertex]
+
+    print("Multi-source tests passed!")
+
+
+def test_nearestFacilityOnDirectedGraph():
+    """
+    Test function for nearest-facility queries on a directed graph: running on `reverseEdges(edges)`
+    gives the distance from each vertex to its nearest facility.
+    """
+    from mindijkstra.mindijkstra_alg_multisource import minHeapMultiSourceDijkstrasAlgorithm, reverseEdges
+
+    edges = [
+        [[1, 7]],                   # Node 0 -> Node 1 (weight 7)
+        [[2, 6], [3, 20], [4, 3]],  # Node 1 -> Node 2 (6), Node 3 (20), Node 4 (3)
+        [[3, 14]],                  # Node 2 -> Node 3 (weight 14)
+        [[4, 2]],                   # Node 3 -> Node 4 (weight 2)
+        [],                         # Node 4 has no outgoing edges
+        []                          # Node 5 has no outgoing edges
+    ]
+    facilities = [3, 4]
+
+    minDistances, nearestSources = minHeapMultiSourceDijkstrasAlgorithm(facilities, reverseEdges(edges))
+    assert minDistances == [10, 3, 14, 0, 0, -1], f"Distances test failed: {minDistances}"
+    assert nearestSources == [4, 4, 3, 3, 4, -1], f"Labels test failed: {nearestSources}"
+
+    print("Nearest-facility test passed!")
+
+
+def test_integerWeights():
+    """
+    Test function for the integer-distance mode of both min-heap engines, with both heap classes:
+    same distances as the float mode on random graphs, -1 for unreachable vertices (also in the path
+    engine), OverflowError when distances could exceed int64 and TypeError for non-int weights.
+    """
+    from difftest.generators import SMALL_SHAPES, generateCase, toAdjacencyList
+
+    rng = random.Random(6)
+    for shape in SMALL_SHAPES:
+        case = generateCase(rng, shape)
+        edges = toAdjacencyList(case)
+        expected = minHeapDijkstrasAlgorithm(case.source, edges)
+        for heapClass in [MinHeap, ArrayMinHeap]:
+            assert minHeapDijkstrasAlgorithm(case.source, edges, heapClass, integerWeights=True) == expected
+
+            minDistances, previousNodes = minHeapDijkstrasAlgorithmWithPaths(
+                case.source, edges, heapClass, integerWeights=True)
+            assert minDistances == expected
+            assert all((previousNodes[vertex] is None) == (distance == -1 or vertex == case.source)
+                       for vertex, distance in enumerate(minDistances))
+
+    invalidCases = [([[[1, 2 ** 62]], [[2, 2 ** 62]], []], OverflowError), ([[[1, 2 ** 64]], []], OverflowError),
+                    ([[[1, 2 ** 64 - 1]], []], OverflowError), ([[[1, 2.5]], []], TypeError)]
+    for engine in [minHeapDijkstrasAlgorithm, minHeapDijkstrasAlgorithmWithPaths]:
+        for heapClass in [MinHeap, ArrayMinHeap]:
+            for invalidEdges, error in invalidCases:
+                try:
+                    engine(0, invalidEdges, heapClass, integerWeights=True)
+                except error:
+                    continue
+                raise AssertionError(f"{engine.__name__} accepted {invalidEdges} without {error.__name__}")
+
+            # Only non-int weights are reported as such; a malformed adjacency list keeps its own TypeError
+            for invalidEdges, relabelled in [([[[1, 2.5]], []], True), ([[None], []], False)]:
+                try:
+                    engine(0, invalidEdges, heapClass, integerWeights=True)
+                except TypeError as error:
+                    assert ("integerWeights" in str(error)) == relabelled, f"{engine.__name__}: {error}"
+                    continue
+                raise AssertionError(f"{engine.__name__} accepted {invalidEdges} without TypeError")
+
+    print("Integer mode tests passed!")
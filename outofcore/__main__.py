@@ -0,0 +1,53 @@
+"""
+Out-of-core single-source shortest paths.
+
+Usage:
+    python -m outofcore build grafos/gnp_100000_0.0001.edgelist store/ [--shard-size 4096] [--directed]
+    python -m outofcore sssp store/ --source 0 [--cache-shards 8]
+"""
+import argparse
+import time
+
+from outofcore.sssp import outOfCoreDijkstrasAlgorithm
+from outofcore.store import ShardStore, buildShardStore
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m outofcore", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="partition an edge list into an on-disk shard store")
+    build.add_argument("edgeList", help="\"source destination [weight]\" text, .csv or binary (.bin) edge list")
+    build.add_argument("storeDir", help="output directory")
+    build.add_argument("--shard-size", type=int, default=4096, help="vertices per shard (default: %(default)s)")
+    build.add_argument("--directed", action="store_true", help="one arc per line instead of an undirected edge")
+    build.add_argument("--partition", default="bfs", choices=["bfs", "none"],
+                       help="vertex order used to cut the shards (default: %(default)s)")
+
+    sssp = subparsers.add_parser("sssp", help="run Dijkstra from one source on a shard store")
+    sssp.add_argument("storeDir", help="directory written by build")
+    sssp.add_argument("--source", type=int, default=0, help="source vertex (default: %(default)s)")
+    sssp.add_argument("--cache-shards", type=int, default=8,
+                      help="shards kept in memory (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    startedAt = time.perf_counter()
+    if args.command == "build":
+        store = buildShardStore(args.edgeList, args.storeDir, args.shard_size, args.directed, args.partition)
+        print(f"{store.numberOfVertices} vertices, {store.meta['numberOfArcs']} arcs, "
+              f"{store.numberOfShards} shards in {time.perf_counter() - startedAt:.2f} s")
+        return
+
+    store = ShardStore(args.storeDir, cacheShards=args.cache_shards)
+    distances = outOfCoreDijkstrasAlgorithm(args.source, store)
+    stats = store.ioStats()
+    reachable = sum(1 for distance in distances if distance != -1)
+    print(f"{reachable}/{store.numberOfVertices} vertices reachable from {args.source} "
+          f"in {time.perf_counter() - startedAt:.2f} s")
+    print(f"shard loads {stats['loads']}, cache hits {stats['hits']}, slice reads {stats['sliceReads']}, "
+          f"{stats['bytesRead'] / 2 ** 20:.1f} MiB paged in (store: {store.storeBytes() / 2 ** 20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+from array import array
+
+import numpy as np
+
+from mindijkstra.arrayheap import ArrayMinHeap
+
+
+# O((v + e) * log(v)) time | O(v + cache) memory — the edges stay on disk
+def outOfCoreDijkstrasAlgorithm(start, store):
+    """
+    Implements Dijkstra's algorithm on a ShardStore, reading the arcs of every vertex removed from the
+    heap through `ShardStore.arcs` (a cached shard, or just that vertex's slice of the files).
+
+    Args:
+        start (int): The starting vertex, in the original vertex IDs of the edge list.
+        store (ShardStore): The on-disk graph.
+
+    Returns:
+        list: A list of minimum distances from the starting vertex to each vertex (original IDs).
+              If a vertex is unreachable, its distance is represented as -1.
+    """
+    numberOfVertices = store.numberOfVertices
+
+    # Distances and the heap are indexed by relabelled vertex IDs.
+    minDistances = array("d", [float("inf")]) * numberOfVertices
+    source = int(store.rank[start])
+    minDistances[source] = 0
+
+    heap = ArrayMinHeap(numberOfVertices)
+    heap.update(source, 0)
+
+    while not heap.isEmpty():
+        vertex, currentMinDistance = heap.remove()
+
+        targets, weights = store.arcs(vertex)
+        for destination, weight in zip(targets, weights):
+            newPathDistance = currentMinDistance + weight
+            if newPathDistance < minDistances[destination]:
+                minDistances[destination] = newPathDistance
+                heap.update(destination, newPathDistance)
+
+    # Map back to the original vertex IDs and mark unreachable vertices with -1.
+    distances = np.frombuffer(minDistances, dtype=np.float64)[store.rank]
+    distances[np.isinf(distances)] = -1
+    if store.meta["weightDtype"] == "int64":
+        return distances.astype(np.int64).tolist()
+    return distances.tolist()
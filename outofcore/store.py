@@ -0,0 +1,267 @@
+import json
+import os
+from array import array
+from collections import OrderedDict
+
+import numpy as np
+
+from ingest.edgelist import readEdgeChunks
+
+META_FILE = "meta.json"
+
+
+def _arcs(sources, destinations, weights, directed):
+    if directed:
+        return sources, destinations, weights
+    return (np.concatenate([sources, destinations]), np.concatenate([destinations, sources]),
+            np.concatenate([weights, weights]))
+
+
+def _scatterRows(sources, cursor):
+    """
+    Returns the CSR slot of every arc of a chunk and advances the per-vertex write cursors.
+    """
+    order = np.argsort(sources, kind="stable")
+    sortedSources = sources[order]
+    uniqueSources, firstIdx, counts = np.unique(sortedSources, return_index=True, return_counts=True)
+    rankInGroup = np.arange(len(sortedSources)) - np.repeat(firstIdx, counts)
+    slots = np.empty(len(sources), dtype=np.int64)
+    slots[order] = cursor[sortedSources] + rankInGroup
+    cursor[uniqueSources] += counts
+    return slots
+
+
+def _bfsOrder(offsets, targets, numberOfVertices):
+    """
+    Orders the vertices by breadth-first search (restarting at the lowest unvisited vertex for every
+    component), so that neighbouring vertices tend to end up in the same shard.
+    """
+    order = np.empty(numberOfVertices, dtype=np.int64)
+    visited = np.zeros(numberOfVertices, dtype=bool)
+    head = tail = 0
+    nextRoot = 0
+    while tail < numberOfVertices:
+        if head == tail:
+            while visited[nextRoot]:
+                nextRoot += 1
+            visited[nextRoot] = True
+            order[tail] = nextRoot
+            tail += 1
+        vertex = order[head]
+        head += 1
+        neighbors = np.asarray(targets[offsets[vertex]:offsets[vertex + 1]])
+        neighbors = np.unique(neighbors[~visited[neighbors]])
+        visited[neighbors] = True
+        order[tail:tail + len(neighbors)] = neighbors
+        tail += len(neighbors)
+    return order
+
+
+def buildShardStore(edgeListPath, storeDir, shardSize=4096, directed=False, partition="bfs",
+                    chunkBytes=64 * 2 ** 20):
+    """
+    Builds an on-disk shard store from an edge list file without holding the edges in memory.
+
+    The edges are streamed twice into a CSR (offsets/targets/weights) stored as .npy files, the vertices
+    are relabelled (BFS order by default) and the relabelled CSR is written so that shard k holds the
+    contiguous vertex range [k * shardSize, (k + 1) * shardSize) with all of its outgoing arcs. Only
+    O(V) arrays are kept in memory; the O(E) arrays are memory-mapped.
+
+    Args:
+        edgeListPath (str): Text, CSV or binary edge list (see `ingest.edgelist.readEdgeChunks`),
+                            vertices 0 .. V - 1.
+        storeDir (str): Output directory.
+        shardSize (int): Number of vertices per shard.
+        directed (bool): Treat each line as a single arc instead of an undirected edge.
+        partition (str): "bfs" to relabel vertices in BFS order, "none" to keep the input order.
+        chunkBytes (int): Approximate number of bytes parsed per chunk.
+
+    Returns:
+        ShardStore: The opened store.
+    """
+    os.makedirs(storeDir, exist_ok=True)
+
+    # Pass 1: out-degrees, number of vertices and weight type.
+    degrees = np.zeros(0, dtype=np.int64)
+    integralWeights = True
+    for sources, destinations, weights in readEdgeChunks(edgeListPath, chunkBytes=chunkBytes):
+        sources, destinations, weights = _arcs(sources, destinations, weights, directed)
+        size = max(len(degrees), int(sources.max()) + 1, int(destinations.max()) + 1)
+        if size > len(degrees):
+            degrees = np.concatenate([degrees, np.zeros(size - len(degrees), dtype=np.int64)])
+        degrees += np.bincount(sources, minlength=len(degrees))
+        integralWeights = integralWeights and bool(np.all(weights == np.floor(weights)))
+
+    numberOfVertices = len(degrees)
+    numberOfArcs = int(degrees.sum())
+    weightDtype = np.int64 if integralWeights else np.float64
+    offsets = np.zeros(numberOfVertices + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+
+    # Pass 2: scatter the arcs into a CSR in input order.
+    rawTargetsPath = os.path.join(storeDir, "raw_targets.npy")
+    rawWeightsPath = os.path.join(storeDir, "raw_weights.npy")
+    rawTargets = np.lib.format.open_memmap(rawTargetsPath, mode="w+", dtype=np.int64, shape=(numberOfArcs,))
+    rawWeights = np.lib.format.open_memmap(rawWeightsPath, mode="w+", dtype=weightDtype, shape=(numberOfArcs,))
+    cursor = offsets[:-1].copy()
+    for sources, destinations, weights in readEdgeChunks(edgeListPath, chunkBytes=chunkBytes):
+        sources, destinations, weights = _arcs(sources, destinations, weights, directed)
+        slots = _scatterRows(sources, cursor)
+        rawTargets[slots] = destinations
+        rawWeights[slots] = weights
+
+    # Relabel the vertices and write the CSR in the new order, one shard-sized block at a time.
+    if partition == "bfs":
+        order = _bfsOrder(offsets, rawTargets, numberOfVertices)
+    elif partition == "none":
+        order = np.arange(numberOfVertices, dtype=np.int64)
+    else:
+        raise ValueError(f"Unknown partition {partition!r} (use 'bfs' or 'none')")
+    rank = np.empty(numberOfVertices, dtype=np.int64)
+    rank[order] = np.arange(numberOfVertices, dtype=np.int64)
+
+    newOffsets = np.zeros(numberOfVertices + 1, dtype=np.int64)
+    np.cumsum(degrees[order], out=newOffsets[1:])
+    targets = np.lib.format.open_memmap(os.path.join(storeDir, "targets.npy"), mode="w+",
+                                        dtype=np.int64, shape=(numberOfArcs,))
+    weightsOut = np.lib.format.open_memmap(os.path.join(storeDir, "weights.npy"), mode="w+",
+                                           dtype=weightDtype, shape=(numberOfArcs,))
+    for blockStart in range(0, numberOfVertices, shardSize):
+        oldVertices = order[blockStart:blockStart + shardSize]
+        lengths = degrees[oldVertices]
+        if lengths.sum() == 0:
+            continue
+        # Indices of every arc of the block in the raw CSR, in new vertex order.
+        starts = offsets[oldVertices] - np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        arcIdx = np.repeat(starts, lengths) + np.arange(lengths.sum())
+        first, last = newOffsets[blockStart], newOffsets[blockStart + len(oldVertices)]
+        targets[first:last] = rank[rawTargets[arcIdx]]
+        weightsOut[first:last] = rawWeights[arcIdx]
+
+    targets.flush()
+    weightsOut.flush()
+    del rawTargets, rawWeights, targets, weightsOut
+    os.remove(rawTargetsPath)
+    os.remove(rawWeightsPath)
+
+    np.save(os.path.join(storeDir, "offsets.npy"), newOffsets)
+    np.save(os.path.join(storeDir, "order.npy"), order)
+    np.save(os.path.join(storeDir, "rank.npy"), rank)
+    with open(os.path.join(storeDir, META_FILE), "w") as file:
+        json.dump({
+            "numberOfVertices": numberOfVertices,
+            "numberOfArcs": numberOfArcs,
+            "shardSize": shardSize,
+            "numberOfShards": -(-numberOfVertices // shardSize),
+            "directed": directed,
+            "partition": partition,
+            "weightDtype": np.dtype(weightDtype).name,
+        }, file, indent=2)
+    return ShardStore(storeDir)
+
+
+class ShardStore:
+    """
+    Read access to a shard store built by `buildShardStore`.
+
+    The offsets (O(V)) are held in memory and the arcs (O(E)) are memory-mapped. `arcs(v)` reads a
+    vertex's arcs from a cached shard when there is one, and otherwise only its own slice of the
+    memory-mapped files, leaving the caching of those pages to the OS. A shard is loaded into the
+    bounded LRU cache of `cacheShards` shards once the slices read from it since it was last cached
+    add up to its size (rent-or-buy), so the bytes paged in are at most twice those of reading every
+    arc once, whatever the cache size.
+    """
+
+    def __init__(self, storeDir, cacheShards=8):
+        """
+        Args:
+            storeDir (str): Directory written by `buildShardStore`.
+            cacheShards (int): Maximum number of shards kept in memory.
+        """
+        with open(os.path.join(storeDir, META_FILE)) as file:
+            self.meta = json.load(file)
+        self.numberOfVertices = self.meta["numberOfVertices"]
+        self.shardSize = self.meta["shardSize"]
+        self.numberOfShards = self.meta["numberOfShards"]
+        offsets = np.load(os.path.join(storeDir, "offsets.npy"))
+        # array("q") indexing returns Python ints without creating NumPy scalars.
+        self.offsets = array("q", offsets.tobytes())
+        self.targets = np.load(os.path.join(storeDir, "targets.npy"), mmap_mode="r")
+        self.weights = np.load(os.path.join(storeDir, "weights.npy"), mmap_mode="r")
+        self.order = np.load(os.path.join(storeDir, "order.npy"), mmap_mode="r")
+        self.rank = np.load(os.path.join(storeDir, "rank.npy"), mmap_mode="r")
+        self.arcBytes = self.targets.itemsize + self.weights.itemsize
+        self.cacheShards = cacheShards
+        self.cache = OrderedDict()
+        self.sliceBytes = [0] * self.numberOfShards
+        self.hits = 0
+        self.loads = 0
+        self.sliceReads = 0
+        self.bytesRead = offsets.nbytes
+
+    def storeBytes(self):
+        """
+        Returns:
+            int: Size of the CSR arrays (offsets, targets and weights) in bytes.
+        """
+        return 8 * len(self.offsets) + self.targets.nbytes + self.weights.nbytes
+
+    def arcs(self, vertex):
+        """
+        Returns the outgoing arcs of (relabelled) vertex `vertex` as two lists, targets (relabelled
+        vertex IDs) and weights.
+        """
+        first, last = self.offsets[vertex], self.offsets[vertex + 1]
+        shardIdx = vertex // self.shardSize
+        cached = self.cache.get(shardIdx)
+        if cached is not None:
+            self.hits += 1
+            self.cache.move_to_end(shardIdx)
+        else:
+            size = (last - first) * self.arcBytes
+            self.sliceBytes[shardIdx] += size
+            if self.sliceBytes[shardIdx] < self._shardArcs(shardIdx) * self.arcBytes:
+                self.sliceReads += 1
+                self.bytesRead += size
+                return self.targets[first:last].tolist(), self.weights[first:last].tolist()
+            cached = self.shard(shardIdx)
+
+        firstArc, targets, weights = cached
+        return targets[first - firstArc:last - firstArc].tolist(), weights[first - firstArc:last - firstArc].tolist()
+
+    def _shardArcs(self, shardIdx):
+        first = shardIdx * self.shardSize
+        last = min(first + self.shardSize, self.numberOfVertices)
+        return self.offsets[last] - self.offsets[first]
+
+    def shard(self, shardIdx):
+        """
+        Returns shard shardIdx as (firstArc, targets, weights): in-memory NumPy copies of the arcs of its
+        vertices, starting at arc firstArc, loaded with one contiguous read per file on a cache miss.
+        """
+        cached = self.cache.get(shardIdx)
+        if cached is not None:
+            self.cache.move_to_end(shardIdx)
+            return cached
+
+        first = shardIdx * self.shardSize
+        last = min(first + self.shardSize, self.numberOfVertices)
+        firstArc, lastArc = self.offsets[first], self.offsets[last]
+        shard = (firstArc, np.array(self.targets[firstArc:lastArc]), np.array(self.weights[firstArc:lastArc]))
+
+        self.loads += 1
+        self.bytesRead += shard[1].nbytes + shard[2].nbytes
+        self.sliceBytes[shardIdx] = 0
+        self.cache[shardIdx] = shard
+        if len(self.cache) > self.cacheShards:
+            self.cache.popitem(last=False)
+        return shard
+
+    def ioStats(self):
+        """
+        Returns:
+            dict: Shard loads, cache hits, single-vertex slice reads and bytes paged in since the store
+                  was opened.
+        """
+        return {"loads": self.loads, "hits": self.hits, "sliceReads": self.sliceReads,
+                "bytesRead": self.bytesRead}
@@ -0,0 +1,72 @@
+import random
+
+from difftest.generators import generateCase
+from difftest.harness import referenceDistances
+from mindijkstra.mindijkstra_alg import minHeapDijkstrasAlgorithm
+from outofcore.sssp import outOfCoreDijkstrasAlgorithm
+from outofcore.store import ShardStore, buildShardStore
+
+
+def _writeEdgeList(path, arcs):
+    with open(path, "w") as file:
+        for u, v, weight in arcs:
+            file.write(f"{u} {v} {weight}\n")
+
+
+def test_outOfCoreMatchesInMemoryEngine(tmp_path):
+    """
+    With a cache smaller than the graph, the out-of-core engine still returns the same distances as
+    `minHeapDijkstrasAlgorithm`, in the original vertex IDs, and never holds more shards than allowed.
+    """
+    rng = random.Random(5)
+    numberOfVertices = 600
+    arcs = [(rng.randrange(numberOfVertices), rng.randrange(numberOfVertices), rng.randint(1, 20))
+            for _ in range(1500)]
+    _writeEdgeList(tmp_path / "edges.txt", arcs)
+
+    edges = [[] for _ in range(numberOfVertices)]
+    for u, v, weight in arcs:
+        edges[u].append([v, weight])
+        edges[v].append([u, weight])
+
+    buildShardStore(str(tmp_path / "edges.txt"), str(tmp_path / "store"), shardSize=32, chunkBytes=4096)
+    store = ShardStore(str(tmp_path / "store"), cacheShards=3)
+    for start in [0, 17, 599]:
+        assert outOfCoreDijkstrasAlgorithm(start, store) == minHeapDijkstrasAlgorithm(start, edges)
+        assert len(store.cache) <= 3
+    assert store.ioStats()["bytesRead"] <= 3 * 2 * store.storeBytes()
+
+
+def test_bytesReadAreBoundedByTheStoreSize(tmp_path):
+    """
+    One SSSP pages in at most twice the store, even with a one-shard cache: vertices whose shard is not
+    cached read only their own arcs instead of the whole shard.
+    """
+    rng = random.Random(8)
+    numberOfVertices = 3000
+    arcs = [(rng.randrange(numberOfVertices), rng.randrange(numberOfVertices), rng.randint(1, 20))
+            for _ in range(9000)]
+    _writeEdgeList(tmp_path / "edges.txt", arcs)
+
+    buildShardStore(str(tmp_path / "edges.txt"), str(tmp_path / "store"), shardSize=64)
+    store = ShardStore(str(tmp_path / "store"), cacheShards=1)
+    outOfCoreDijkstrasAlgorithm(0, store)
+    stats = store.ioStats()
+    assert stats["bytesRead"] <= 2 * store.storeBytes()
+    assert stats["loads"] <= store.numberOfShards
+
+
+def test_directedGraphsWithIsolatedVertices(tmp_path):
+    """
+    Directed stores built without relabelling agree with the reference on random directed graphs.
+    """
+    rng = random.Random(11)
+    for caseIdx in range(5):
+        case = generateCase(rng, "directed")
+        # Pin the vertex count by adding a self-loop on the last vertex.
+        arcs = case.arcs + [(case.numberOfVertices - 1, case.numberOfVertices - 1, 1)]
+        _writeEdgeList(tmp_path / f"edges{caseIdx}.txt", arcs)
+        for partition in ["bfs", "none"]:
+            store = buildShardStore(str(tmp_path / f"edges{caseIdx}.txt"), str(tmp_path / f"store{caseIdx}{partition}"),
+                                    shardSize=4, directed=True, partition=partition)
+            assert outOfCoreDijkstrasAlgorithm(case.source, store) == referenceDistances(case._replace(arcs=arcs))
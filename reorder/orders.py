@@ -0,0 +1,140 @@
+from collections import deque
+
+
+def bfsOrder(edges):
+    """
+    Orders the vertices by breadth-first search, restarting at the lowest unvisited vertex for every
+    component, so that vertices that are close in the graph get close IDs.
+
+    Args:
+        edges (list of list): Adjacency list of [destination, weight] pairs.
+
+    Returns:
+        list: The permutation `order`, where order[newId] is the original ID of the vertex.
+    """
+    numberOfVertices = len(edges)
+    visited = [False] * numberOfVertices
+    order = []
+    for root in range(numberOfVertices):
+        if visited[root]:
+            continue
+        visited[root] = True
+        queue = deque([root])
+        while queue:
+            vertex = queue.popleft()
+            order.append(vertex)
+            for destination, _ in edges[vertex]:
+                if not visited[destination]:
+                    visited[destination] = True
+                    queue.append(destination)
+    return order
+
+
+def reverseCuthillMcKeeOrder(edges):
+    """
+    Orders the vertices with the reverse Cuthill–McKee algorithm: a BFS from a minimum-degree vertex of
+    every component that visits neighbours by increasing degree, reversed at the end. It reduces the
+    bandwidth of the adjacency matrix, i.e. |newId(u) - newId(v)| over the edges.
+
+    Args:
+        edges (list of list): Adjacency list of [destination, weight] pairs.
+
+    Returns:
+        list: The permutation `order`, where order[newId] is the original ID of the vertex.
+    """
+    numberOfVertices = len(edges)
+    degrees = [len(neighbors) for neighbors in edges]
+    visited = [False] * numberOfVertices
+    order = []
+    for root in sorted(range(numberOfVertices), key=degrees.__getitem__):
+        if visited[root]:
+            continue
+        visited[root] = True
+        queue = deque([root])
+        while queue:
+            vertex = queue.popleft()
+            order.append(vertex)
+            neighbors = {destination for destination, _ in edges[vertex] if not visited[destination]}
+            for destination in sorted(neighbors, key=degrees.__getitem__):
+                visited[destination] = True
+                queue.append(destination)
+    order.reverse()
+    return order
+
+
+def degreeOrder(edges):
+    """
+    Orders the vertices by decreasing degree, so the hubs that most relaxations touch share the first
+    cache lines of the distance arrays.
+
+    Args:
+        edges (list of list): Adjacency list of [destination, weight] pairs.
+
+    Returns:
+        list: The permutation `order`, where order[newId] is the original ID of the vertex.
+    """
+    return sorted(range(len(edges)), key=lambda vertex: -len(edges[vertex]))
+
+
+ORDERINGS = {
+    "bfs": bfsOrder,
+    "rcm": reverseCuthillMcKeeOrder,
+    "degree": degreeOrder,
+}
+
+
+class ReorderedGraph:
+    """
+    A copy of a graph whose vertices are relabelled by a permutation, that runs engines on the
+    relabelled copy and translates their results back to the caller's vertex IDs.
+    """
+
+    def __init__(self, edges, method="rcm"):
+        """
+        Args:
+            edges (list of list): Adjacency list of [destination, weight] pairs, in original IDs.
+            method (str): "bfs", "rcm" or "degree".
+
+        Attributes:
+            order (list): order[newId] is the original ID of the vertex.
+            rank (list): rank[originalId] is the new ID of the vertex.
+            edges (list of list): The relabelled adjacency list, with each vertex's neighbours sorted by ID.
+        """
+        if method not in ORDERINGS:
+            raise ValueError(f"Unknown ordering {method!r} (use one of {list(ORDERINGS)})")
+        self.method = method
+        self.order = ORDERINGS[method](edges)
+        self.rank = [0] * len(edges)
+        for newId, originalId in enumerate(self.order):
+            self.rank[originalId] = newId
+
+        rank = self.rank
+        self.edges = [
+            sorted([rank[destination], weight] for destination, weight in edges[originalId])
+            for originalId in self.order
+        ]
+
+    def toOriginal(self, values):
+        """
+        Reorders a per-vertex list (indexed by new IDs) into the original vertex order.
+        """
+        return [values[newId] for newId in self.rank]
+
+    def run(self, engine, start):
+        """
+        Runs engine(start, edges) on the relabelled graph.
+
+        Args:
+            engine (callable): A distance engine or a path engine returning (distances, previousNodes).
+            start (int): The starting vertex, in original IDs.
+
+        Returns:
+            The engine's result with every list indexed by, and every vertex given in, original IDs.
+        """
+        result = engine(self.rank[start], self.edges)
+        if isinstance(result, tuple):
+            minDistances, previousNodes = result
+            order = self.order
+            previousNodes = [None if vertex is None else order[vertex] for vertex in previousNodes]
+            return self.toOriginal(minDistances), self.toOriginal(previousNodes)
+        return self.toOriginal(result)
@@ -0,0 +1,59 @@
+import random
+
+from difftest.generators import SMALL_SHAPES, generateCase, toAdjacencyList
+from dijkstra.dijkstra_alg_paths import reconstructPath
+from mindijkstra.mindijkstra_alg import minHeapDijkstrasAlgorithm
+from mindijkstra.mindijkstra_alg_paths import minHeapDijkstrasAlgorithmWithPaths
+from reorder.orders import ORDERINGS, ReorderedGraph, reverseCuthillMcKeeOrder
+
+
+def test_orderingsArePermutations():
+    """
+    Every ordering returns a permutation of the vertices, including on disconnected graphs.
+    """
+    rng = random.Random(3)
+    for shape in SMALL_SHAPES:
+        edges = toAdjacencyList(generateCase(rng, shape))
+        for method, ordering in ORDERINGS.items():
+            assert sorted(ordering(edges)) == list(range(len(edges))), method
+
+
+def test_reverseCuthillMcKeeReducesBandwidthOfShuffledPath():
+    """
+    On a path graph with shuffled IDs, RCM recovers an order where every edge joins consecutive IDs.
+    """
+    rng = random.Random(0)
+    labels = list(range(50))
+    rng.shuffle(labels)
+    edges = [[] for _ in labels]
+    for u, v in zip(labels, labels[1:]):
+        edges[u].append([v, 1])
+        edges[v].append([u, 1])
+
+    order = reverseCuthillMcKeeOrder(edges)
+    rank = {vertex: newId for newId, vertex in enumerate(order)}
+    assert max(abs(rank[u] - rank[v]) for u in range(50) for v, _ in edges[u]) == 1
+
+
+def test_resultsAreReturnedInOriginalIds():
+    """
+    Engines run on a reordered graph give the same distances as on the original graph, and predecessor
+    lists translated back to original IDs describe valid paths.
+    """
+    rng = random.Random(9)
+    for shape in ["sparse", "disconnected", "directed", "parallel-edges"]:
+        case = generateCase(rng, shape)
+        edges = toAdjacencyList(case)
+        expected = minHeapDijkstrasAlgorithm(case.source, edges)
+        for method in ORDERINGS:
+            reordered = ReorderedGraph(edges, method)
+            assert reordered.run(minHeapDijkstrasAlgorithm, case.source) == expected
+
+            minDistances, previousNodes = reordered.run(minHeapDijkstrasAlgorithmWithPaths, case.source)
+            for vertex, distance in enumerate(expected):
+                path = reconstructPath(previousNodes, case.source, vertex)
+                if distance == -1:
+                    assert minDistances[vertex] == float("inf") and path == []
+                else:
+                    assert path[0] == case.source and path[-1] == vertex
+                    assert minDistances[vertex] == distance
@@ -0,0 +1,182 @@
+import base64
+import html
+import os
+
+from report.cache import FigureCache
+from report.figures import drawLatency, drawMetric, drawScaling, drawSpeedup, fitPowerLaw
+
+DEFAULT_BASELINE = "Dijkstra Clássico"
+PALETTE = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f",
+           "#bcbd22", "#17becf"]
+
+# Small inline script: click a table header to sort by that column.
+_SORT_SCRIPT = """
+document.querySelectorAll("table.sortable th").forEach((th, column) => th.addEventListener("click", () => {
+  const body = th.closest("table").tBodies[0];
+  const ascending = th.dataset.order !== "asc";
+  th.dataset.order = ascending ? "asc" : "desc";
+  const value = row => { const text = row.cells[column].dataset.value ?? row.cells[column].textContent;
+                         const number = parseFloat(text); return isNaN(number) ? text : number; };
+  [...body.rows].sort((a, b) => (value(a) > value(b) ? 1 : value(a) < value(b) ? -1 : 0) * (ascending ? 1 : -1))
+    .forEach(row => body.appendChild(row));
+}));
+"""
+
+_STYLE = """
+body { font-family: sans-serif; margin: 2em auto; max-width: 1100px; color: #222; }
+details { margin: 1em 0; border: 1px solid #ddd; border-radius: 6px; padding: 0.5em 1em; }
+summary { font-size: 1.2em; font-weight: bold; cursor: pointer; }
+.grid { display: flex; flex-wrap: wrap; gap: 1em; }
+.grid img { width: 48%; min-width: 420px; }
+img { max-width: 100%; }
+table { border-collapse: collapse; margin: 1em 0; font-size: 0.9em; }
+th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: right; }
+th { background: #f3f3f3; cursor: pointer; }
+td:first-child, th:first-child { text-align: left; }
+"""
+
+
+def loadRawResults(paths):
+    """
+    Reads and concatenates raw result CSVs (`dijkstra_experiment_raw_results.csv`), e.g. one per run.
+    """
+    import pandas as pd
+
+    return pd.concat([pd.read_csv(path) for path in paths], ignore_index=True)
+
+
+def _graphGroups(frame):
+    """Yields (label, rows) for every graph configuration (topology, density) present in the results."""
+    keys = [key for key in ["Topology", "Density"] if key in frame]
+    if not keys:
+        yield "", frame
+        return
+    for values, rows in frame.groupby(keys, sort=True):
+        values = values if isinstance(values, tuple) else (values,)
+        yield ", ".join(f"densidade {value}" if key == "Density" else str(value)
+                        for key, value in zip(keys, values)), rows
+
+
+def _image(png, alt):
+    encoded = base64.b64encode(png).decode("ascii")
+    return f'<img src="data:image/png;base64,{encoded}" alt="{html.escape(alt)}">'
+
+
+def _table(headers, rows):
+    head = "".join(f"<th>{html.escape(header)}</th>" for header in headers)
+    body = "".join(
+        "<tr>" + "".join(f'<td data-value="{html.escape(str(value))}">{html.escape(text)}</td>'
+                         for text, value in row) + "</tr>"
+        for row in rows)
+    return f'<table class="sortable"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
+
+
+def _number(value, digits=4):
+    return ("—", "") if value != value else (f"{value:.{digits}g}", value)
+
+
+def buildReport(rawResults, outputPath, cacheDir=None, baseline=None):
+    """
+    Writes a self-contained HTML report of a benchmark: per graph configuration, log-log scaling with
+    fitted power laws, speedup over a baseline, time distributions per size, CO₂ emission and peak
+    memory panels, and sortable tables. Figures are embedded as PNGs and cached under a hash of the
+    data they plot, so adding one size only re-renders the figures that depend on it.
+
+    Args:
+        rawResults (pd.DataFrame): Raw results, as written by `main.run_experiment`.
+        outputPath (str): HTML file to write.
+        cacheDir (str): Figure cache directory. Defaults to ".report-cache" next to outputPath.
+        baseline (str): Display name of the speedup baseline. Defaults to the classic algorithm if
+                        present, otherwise the first algorithm in the results.
+
+    Returns:
+        dict: "figures", "rendered" and "reused" counts.
+    """
+    from main import summarize_results
+
+    if cacheDir is None:
+        cacheDir = os.path.join(os.path.dirname(os.path.abspath(outputPath)), ".report-cache")
+    cache = FigureCache(cacheDir)
+
+    algorithms = list(dict.fromkeys(rawResults["Algorithm"]))
+    colors = {algorithm: PALETTE[idx % len(PALETTE)] for idx, algorithm in enumerate(sorted(algorithms))}
+    if baseline is None:
+        baseline = DEFAULT_BASELINE if DEFAULT_BASELINE in algorithms else algorithms[0]
+    elif baseline not in algorithms:
+        raise ValueError(f"Baseline {baseline!r} not in the results (use one of {algorithms})")
+
+    measuresCo2 = "CO2 Emission (kg)" in rawResults and bool(rawResults["CO2 Emission (kg)"].any())
+    measuresMemory = "Peak Memory (MiB)" in rawResults
+    sections = []
+    figureCount = 0
+
+    for label, rows in _graphGroups(rawResults):
+        summary = summarize_results(rows)
+        summary["CI_Low"] = [low for low, _ in summary["Time CI 95%"]]
+        summary["CI_High"] = [high for _, high in summary["Time CI 95%"]]
+        baselineTimes = summary[summary["Algorithm"] == baseline].set_index("Nodes")["Mean_Time"]
+        summary["Speedup"] = summary["Nodes"].map(baselineTimes) / summary["Mean_Time"]
+        suffix = f" — {label}" if label else ""
+        figures = []
+
+        figures.append(cache.render(
+            "scaling", drawScaling, summary[["Algorithm", "Nodes", "Mean_Time", "CI_Low", "CI_High"]],
+            colors=colors, title=f"Escalabilidade (log-log){suffix}"))
+        if not baselineTimes.empty:
+            figures.append(cache.render(
+                "speedup", drawSpeedup, summary[["Algorithm", "Nodes", "Speedup"]].dropna(),
+                colors=colors, baseline=baseline, title=f"Speedup sobre {baseline}{suffix}"))
+        if measuresCo2:
+            figures.append(cache.render(
+                "co2", drawMetric, summary[["Algorithm", "Nodes", "Mean_CO2"]], colors=colors,
+                column="Mean_CO2", ylabel="Emissão Média de CO₂ (kg, log)", title=f"Emissão de CO₂{suffix}"))
+        if measuresMemory:
+            figures.append(cache.render(
+                "memory", drawMetric, summary[["Algorithm", "Nodes", "Mean_Memory"]], colors=colors,
+                column="Mean_Memory", ylabel="Pico de Memória (MiB, log)", title=f"Pico de Memória{suffix}"))
+
+        latencies = [
+            cache.render("latency", drawLatency, sizeRows[["Algorithm", "Time (s)"]], colors=colors,
+                         title=f"Distribuição dos tempos, n = {nodes}{suffix}")
+            for nodes, sizeRows in rows.groupby("Nodes", sort=True)
+        ]
+        figureCount += len(figures) + len(latencies)
+
+        fits = []
+        for algorithm, group in summary.groupby("Algorithm", sort=False):
+            fit = fitPowerLaw(group["Nodes"], group["Mean_Time"])
+            if fit is not None:
+                fits.append([(algorithm, algorithm), _number(fit[0], 3), _number(fit[1]), _number(fit[2], 3)])
+
+        headers = ["Algoritmo", "Nós", "Execuções", "Tempo Médio (s)", "IC 95%", f"Speedup ({baseline})"]
+        headers += ["CO₂ Médio (kg)"] if measuresCo2 else []
+        headers += ["Memória (MiB)"] if measuresMemory else []
+        tableRows = []
+        for row in summary.itertuples(index=False):
+            tableRow = [(row.Algorithm, row.Algorithm), (str(row.Nodes), row.Nodes), (str(row.Runs), row.Runs),
+                        _number(row.Mean_Time), (f"{row.CI_Low:.4g} – {row.CI_High:.4g}", row.CI_Low),
+                        _number(row.Speedup, 3)]
+            tableRow += [_number(row.Mean_CO2)] if measuresCo2 else []
+            tableRow += [_number(row.Mean_Memory)] if measuresMemory else []
+            tableRows.append(tableRow)
+
+        sections.append(
+            f"<details open><summary>{html.escape(label or 'Resultados')}</summary>"
+            + '<div class="grid">' + "".join(_image(png, "gráfico") for png in figures) + "</div>"
+            + "<h3>Ajuste de complexidade (tempo ≈ c · n<sup>k</sup>)</h3>"
+            + _table(["Algoritmo", "Expoente k", "Coeficiente c", "R²"], fits)
+            + "<h3>Resumo</h3>" + _table(headers, tableRows)
+            + "<h3>Distribuição dos tempos por tamanho</h3>"
+            + '<div class="grid">' + "".join(_image(png, "distribuição") for png in latencies) + "</div>"
+            + "</details>")
+
+    document = (
+        '<!DOCTYPE html><html lang="pt-br"><head><meta charset="utf-8">'
+        f"<title>Comparação de Dijkstra</title><style>{_STYLE}</style></head><body>"
+        "<h1>Comparação de desempenho das implementações de Dijkstra</h1>"
+        f"<p>{len(rawResults)} medições, {len(algorithms)} algoritmos. "
+        "Clique no cabeçalho de uma tabela para ordenar; as linhas tracejadas são os ajustes de lei de potência.</p>"
+        + "".join(sections) + f"<script>{_SORT_SCRIPT}</script></body></html>")
+    with open(outputPath, "w", encoding="utf-8") as file:
+        file.write(document)
+    return {"figures": figureCount, "rendered": cache.rendered, "reused": cache.reused}
@@ -0,0 +1,92 @@
+import hashlib
+import io
+import json
+import os
+
+# Bump when a drawing function changes, so figures cached by older code are re-rendered.
+RENDER_VERSION = 1
+
+
+class FigureCache:
+    """
+    Renders matplotlib figures to PNG and caches them on disk under a hash of everything that
+    determines the image: the figure name, its parameters and the data it plots.
+    """
+
+    def __init__(self, cacheDir=None):
+        """
+        Args:
+            cacheDir (str): Directory of cached PNGs. None keeps the cache in memory only.
+
+        Attributes:
+            rendered (int): Figures drawn by this cache.
+            reused (int): Figures served from the cache without drawing.
+        """
+        self.cacheDir = cacheDir
+        self.memory = {}
+        self.rendered = 0
+        self.reused = 0
+        if cacheDir is not None:
+            os.makedirs(cacheDir, exist_ok=True)
+
+    @staticmethod
+    def key(name, data, params):
+        """
+        Returns the cache key of a figure: a SHA-256 of its name, the render version, its parameters
+        and its data serialized as CSV.
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps([name, RENDER_VERSION, params], sort_keys=True, default=str).encode())
+        digest.update(data.to_csv(index=False).encode())
+        return digest.hexdigest()
+
+    def render(self, name, draw, data, **params):
+        """
+        Returns the PNG of draw(ax, data, **params), drawing it only if no figure with the same key is
+        cached.
+
+        Args:
+            name (str): Figure name, part of the key and of the cached file name.
+            draw (callable): Function that plots `data` on a matplotlib Axes.
+            data (pd.DataFrame): Exactly the data the figure depends on.
+            **params: JSON-serializable drawing parameters.
+
+        Returns:
+            bytes: The PNG image.
+        """
+        key = self.key(name, data, params)
+        path = os.path.join(self.cacheDir, f"{name}-{key[:20]}.png") if self.cacheDir is not None else None
+        if key in self.memory:
+            self.reused += 1
+            return self.memory[key]
+        if path is not None and os.path.exists(path):
+            with open(path, "rb") as file:
+                png = file.read()
+            self.memory[key] = png
+            self.reused += 1
+            return png
+
+        png = self._draw(draw, data, params)
+        self.rendered += 1
+        self.memory[key] = png
+        if path is not None:
+            # Write then rename, so an interrupted run never leaves a truncated PNG in the cache.
+            with open(path + ".tmp", "wb") as file:
+                file.write(png)
+            os.replace(path + ".tmp", path)
+        return png
+
+    @staticmethod
+    def _draw(draw, data, params):
+        # Figure objects without pyplot: no global state, no GUI backend, nothing to close.
+        import matplotlib.style
+        from matplotlib.figure import Figure
+
+        with matplotlib.style.context("seaborn-v0_8-whitegrid"):
+            figure = Figure(figsize=(8, 4.5))
+            ax = figure.subplots()
+            draw(ax, data, **params)
+            figure.tight_layout()
+            buffer = io.BytesIO()
+            figure.savefig(buffer, format="png", dpi=100, metadata={"Software": None})
+        return buffer.getvalue()
@@ -0,0 +1,93 @@
+# Drawing functions of the benchmark report. Each one plots a small DataFrame on a matplotlib Axes and
+# is called through `FigureCache.render`, so it must depend only on its arguments.
+import numpy as np
+
+
+def fitPowerLaw(nodes, times):
+    """
+    Fits times ≈ coefficient * nodes ** exponent by least squares in log-log space.
+
+    Returns:
+        tuple: (exponent, coefficient, r2), or None with fewer than two distinct sizes.
+    """
+    nodes, times = np.asarray(nodes, dtype=float), np.asarray(times, dtype=float)
+    keep = (nodes > 0) & (times > 0)
+    nodes, times = np.log(nodes[keep]), np.log(times[keep])
+    if len(np.unique(nodes)) < 2:
+        return None
+    exponent, intercept = np.polyfit(nodes, times, 1)
+    residuals = times - (exponent * nodes + intercept)
+    total = np.sum((times - times.mean()) ** 2)
+    r2 = 1 - np.sum(residuals ** 2) / total if total > 0 else 1.0
+    return float(exponent), float(np.exp(intercept)), float(r2)
+
+
+def _finishAxes(ax, title, xlabel, ylabel):
+    ax.set_title(title, fontsize=13)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(True, which="both", linestyle="--", alpha=0.5)
+    if ax.get_legend_handles_labels()[0]:
+        ax.legend(fontsize=9)
+
+
+def drawScaling(ax, data, colors, title):
+    """
+    Mean time vs. number of nodes on log-log axes with 95% CI error bars and, for every algorithm with
+    at least two sizes, the fitted power law as a dashed overlay.
+    """
+    for algorithm, group in data.groupby("Algorithm", sort=False):
+        group = group.sort_values("Nodes")
+        errors = [group["Mean_Time"] - group["CI_Low"], group["CI_High"] - group["Mean_Time"]]
+        fit = fitPowerLaw(group["Nodes"], group["Mean_Time"])
+        label = algorithm if fit is None else f"{algorithm} (≈ $n^{{{fit[0]:.2f}}}$)"
+        ax.errorbar(group["Nodes"], group["Mean_Time"], yerr=np.clip(errors, 0, None), marker="o",
+                    capsize=4, color=colors.get(algorithm), label=label)
+        if fit is not None:
+            exponent, coefficient, _ = fit
+            sizes = np.geomspace(group["Nodes"].min(), group["Nodes"].max(), 50)
+            ax.plot(sizes, coefficient * sizes ** exponent, linestyle="--", linewidth=1,
+                    color=colors.get(algorithm), alpha=0.7)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    _finishAxes(ax, title, "Número de Nós (log)", "Tempo de Execução Médio (s, log)")
+
+
+def drawSpeedup(ax, data, colors, baseline, title):
+    """
+    Speedup of every algorithm over the baseline (baseline mean time / mean time) per number of nodes.
+    """
+    for algorithm, group in data.groupby("Algorithm", sort=False):
+        group = group.sort_values("Nodes")
+        ax.plot(group["Nodes"], group["Speedup"], marker="o", color=colors.get(algorithm), label=algorithm)
+    ax.axhline(1, color="gray", linewidth=1)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    _finishAxes(ax, title, "Número de Nós (log)", f"Speedup sobre {baseline} (log)")
+
+
+def drawLatency(ax, data, colors, title):
+    """
+    Distribution of the per-repetition times of every algorithm for one graph size (box plot).
+    """
+    algorithms = list(dict.fromkeys(data["Algorithm"]))
+    samples = [data.loc[data["Algorithm"] == algorithm, "Time (s)"] for algorithm in algorithms]
+    boxes = ax.boxplot(samples, patch_artist=True, widths=0.6)
+    for box, algorithm in zip(boxes["boxes"], algorithms):
+        box.set_facecolor(colors.get(algorithm, "white"))
+        box.set_alpha(0.6)
+    ax.set_xticks(range(1, len(algorithms) + 1), algorithms, rotation=15, fontsize=9)
+    ax.set_yscale("log")
+    _finishAxes(ax, title, "", "Tempo por repetição (s, log)")
+
+
+def drawMetric(ax, data, colors, column, ylabel, title):
+    """
+    Mean of a per-repetition metric (CO₂ emission, peak memory) vs. number of nodes on log-log axes.
+    """
+    for algorithm, group in data.groupby("Algorithm", sort=False):
+        group = group.sort_values("Nodes")
+        ax.plot(group["Nodes"], group[column], marker="o", color=colors.get(algorithm), label=algorithm)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    _finishAxes(ax, title, "Número de Nós (log)", ylabel)
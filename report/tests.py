@@ -0,0 +1,46 @@
+import random
+
+import pandas as pd
+
+from report.builder import buildReport
+from report.figures import fitPowerLaw
+
+
+def _rawResults(sizes, seed=0):
+    """Synthetic raw results: a quadratic and an n log n algorithm, 5 repetitions per size."""
+    rng = random.Random(seed)
+    rows = []
+    for nodes in sizes:
+        for repetition in range(1, 6):
+            for algorithm, cost in [("Dijkstra Clássico", nodes ** 2 * 1e-8), ("Dijkstra com Min-Heap", nodes * 1e-6)]:
+                rows.append({"Algorithm": algorithm, "Time (s)": cost * rng.uniform(0.9, 1.1),
+                             "CO2 Emission (kg)": cost * 1e-7, "Peak Memory (MiB)": nodes * 1e-3,
+                             "Topology": "gnp", "Density": 0.1, "Nodes": nodes, "Repetition": repetition})
+    return pd.DataFrame(rows)
+
+
+def test_fitPowerLawRecoversExponent():
+    exponent, coefficient, r2 = fitPowerLaw([100, 1000, 10000], [3e-4, 3e-2, 3.0])
+    assert abs(exponent - 2) < 1e-9 and abs(coefficient - 3e-8) < 1e-15 and r2 > 0.999
+    assert fitPowerLaw([100, 100], [1.0, 2.0]) is None
+
+
+def test_reportIsSelfContainedAndCachesFigures(tmp_path):
+    """
+    The report embeds every figure; building it again reuses every cached figure, and adding one size
+    re-renders only the figures over all sizes plus the new size's time distribution.
+    """
+    output, cacheDir = str(tmp_path / "report.html"), str(tmp_path / "cache")
+
+    stats = buildReport(_rawResults([100, 200, 400]), output, cacheDir)
+    document = open(output, encoding="utf-8").read()
+    # Scaling, speedup, CO2 and memory panels plus one time distribution per size.
+    assert stats == {"figures": 7, "rendered": 7, "reused": 0}
+    assert document.count('src="data:image/png;base64,') == 7
+    assert "http://" not in document and "https://" not in document
+    assert "Dijkstra com Min-Heap" in document and "Expoente k" in document
+
+    assert buildReport(_rawResults([100, 200, 400]), output, cacheDir)["rendered"] == 0
+
+    stats = buildReport(_rawResults([100, 200, 400, 800]), output, cacheDir)
+    assert stats == {"figures": 8, "rendered": 5, "reused": 3}
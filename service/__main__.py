@@ -0,0 +1,75 @@
+"""
+Local shortest-path query server.
+
+Usage:
+    python -m service --graph grafos/gnp_1000_0.01.edgelist [--port 8080] [--workers 4]
+    python -m service --nodes 5000 --topology ba --ba-m 3
+
+Then query it with:
+    curl 'http://127.0.0.1:8080/path?source=0&target=42'
+    curl 'http://127.0.0.1:8080/metrics'
+"""
+import argparse
+import asyncio
+
+from service.server import HEAP_CLASSES, QueryService, readEdgeList
+
+
+def loadGraph(args):
+    if args.graph:
+        return readEdgeList(args.graph, directed=args.directed)
+
+    from main import convert_nx_to_adj_list, generate_connected_weighted_graph
+
+    density = args.gnp_p if args.topology == "gnp" else args.ba_m
+    graph = generate_connected_weighted_graph(args.nodes, args.topology, density, args.seed)
+    return convert_nx_to_adj_list(graph)
+
+
+async def serve(args):
+    edges = loadGraph(args)
+    service = QueryService(edges, workers=args.workers, heap=args.heap)
+    port = await service.start(args.host, args.port)
+    # The load generator waits for this line when it spawns the server.
+    print(f"Serving {len(edges)} vertices on http://{args.host}:{port}", flush=True)
+    try:
+        await service.server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    from main import DEFAULT_DENSITIES, check_density
+
+    parser = argparse.ArgumentParser(prog="python -m service", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    graph = parser.add_mutually_exclusive_group(required=True)
+    graph.add_argument("--graph", help="edge list file: text (source destination weight per line), .csv or binary (.bin)")
+    graph.add_argument("--nodes", type=int, help="generate a graph with this many nodes instead")
+    parser.add_argument("--directed", action="store_true", help="treat the edge list as directed")
+    parser.add_argument("--topology", default="gnp", choices=["gnp", "ba"], help="generator (default: %(default)s)")
+    parser.add_argument("--gnp-p", type=float, default=DEFAULT_DENSITIES["gnp"][0],
+                        help="edge probability p for gnp, in (0, 1] (default: %(default)s)")
+    parser.add_argument("--ba-m", type=int, default=DEFAULT_DENSITIES["ba"][0],
+                        help="edges m per new node for ba, less than --nodes (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=42, help="generator seed (default: %(default)s)")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8080, help="port, 0 for any free port (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--heap", default="minheap-array", choices=list(HEAP_CLASSES),
+                        help="heap used by the engine (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.nodes is not None:
+        try:
+            check_density(args.topology, args.gnp_p if args.topology == "gnp" else args.ba_m, args.nodes)
+        except ValueError as error:
+            parser.error(str(error))
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Load generator for the query server.
+
+Sends /path requests from many concurrent keep-alive connections and reports client-side throughput
+and latency percentiles, followed by the server's own /metrics. With --spawn it starts a local server
+on a free port first, so the whole benchmark runs without any external service.
+
+Usage:
+    python -m service.loadgen --spawn --nodes 5000 --requests 2000 --concurrency 64 --hot-sources 20
+    python -m service.loadgen --url http://127.0.0.1:8080 --requests 5000
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+
+async def request(reader, writer, host, target):
+    """
+    Sends one GET request on an open keep-alive connection.
+
+    Returns:
+        tuple: (HTTP status code, decoded JSON body).
+    """
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+    await writer.drain()
+    statusLine = await reader.readline()
+    if not statusLine:
+        raise ConnectionError("server closed the connection")
+    contentLength = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            contentLength = int(value)
+    body = await reader.readexactly(contentLength)
+    return int(statusLine.split()[1]), json.loads(body)
+
+
+async def getJson(host, port, target):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        return (await request(reader, writer, host, target))[1]
+    finally:
+        writer.close()
+
+
+async def runLoad(host, port, requests=1000, concurrency=32, hotSources=0, seed=0):
+    """
+    Runs the load test against a running server.
+
+    Args:
+        host (str): Server address.
+        port (int): Server port.
+        requests (int): Total number of /path requests.
+        concurrency (int): Number of concurrent connections.
+        hotSources (int): If > 0, sources are drawn from this many vertices only, so that concurrent
+                          requests share sources and get coalesced. 0 draws sources uniformly.
+        seed (int): Seed for the random queries.
+
+    Returns:
+        dict: Client-side statistics (requests, errors, seconds, throughput, latency percentiles in ms).
+    """
+    numberOfVertices = (await getJson(host, port, "/health"))["vertices"]
+    rng = random.Random(seed)
+    sources = rng.sample(range(numberOfVertices), min(hotSources, numberOfVertices)) if hotSources else None
+    queries = asyncio.Queue()
+    for _ in range(requests):
+        source = rng.choice(sources) if sources else rng.randrange(numberOfVertices)
+        queries.put_nowait(f"/path?source={source}&target={rng.randrange(numberOfVertices)}")
+
+    latencies = []
+    errors = 0
+
+    async def client():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while not queries.empty():
+                target = queries.get_nowait()
+                startedAt = time.perf_counter()
+                status, _ = await request(reader, writer, host, target)
+                latencies.append(time.perf_counter() - startedAt)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    startedAt = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    seconds = time.perf_counter() - startedAt
+
+    latencies.sort()
+
+    def percentile(fraction):
+        return 1000 * latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": seconds,
+        "throughputPerSecond": len(latencies) / seconds,
+        "latencyMs": {"p50": percentile(0.50), "p95": percentile(0.95),
+                      "p99": percentile(0.99), "max": 1000 * latencies[-1]},
+    }
+
+
+def spawnServer(serverArgs):
+    """
+    Starts `python -m service` on a free port and waits until it is ready.
+
+    Returns:
+        tuple: (process, host, port).
+    """
+    process = subprocess.Popen([sys.executable, "-m", "service", "--port", "0", *serverArgs],
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("Serving"):
+        process.kill()
+        raise RuntimeError(f"server failed to start: {line!r}")
+    url = urlsplit(line.split()[-1])
+    return process, url.hostname, url.port
+
+
+def main(argv=None):
+    from main import DEFAULT_DENSITIES
+
+    parser = argparse.ArgumentParser(prog="python -m service.loadgen", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="address of a running server, e.g. http://127.0.0.1:8080")
+    target.add_argument("--spawn", action="store_true", help="start a local server for the benchmark")
+    parser.add_argument("--nodes", type=int, default=2000, help="graph size for --spawn (default: %(default)s)")
+    parser.add_argument("--topology", default="gnp", choices=["gnp", "ba"], help="generator for --spawn")
+    parser.add_argument("--gnp-p", type=float, default=DEFAULT_DENSITIES["gnp"][0],
+                        help="edge probability p for gnp, for --spawn (default: %(default)s)")
+    parser.add_argument("--ba-m", type=int, default=DEFAULT_DENSITIES["ba"][0],
+                        help="edges m per new node for ba, for --spawn (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None, help="server worker processes for --spawn")
+    parser.add_argument("--requests", type=int, default=1000, help="number of requests (default: %(default)s)")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent connections (default: %(default)s)")
+    parser.add_argument("--hot-sources", type=int, default=0,
+                        help="draw sources from this many vertices only (default: uniform)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the queries (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.spawn:
+        serverArgs = ["--nodes", str(args.nodes), "--topology", args.topology,
+                      "--gnp-p", str(args.gnp_p), "--ba-m", str(args.ba_m)]
+        if args.workers:
+            serverArgs += ["--workers", str(args.workers)]
+        process, host, port = spawnServer(serverArgs)
+    else:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+
+    try:
+        client = asyncio.run(runLoad(host, port, args.requests, args.concurrency, args.hot_sources, args.seed))
+        server = asyncio.run(getJson(host, port, "/metrics"))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print(f"{client['requests']} requests in {client['seconds']:.2f} s "
+          f"({client['throughputPerSecond']:.1f} req/s, {client['errors']} errors)")
+    latency = client["latencyMs"]
+    print(f"client latency ms: p50 {latency['p50']:.1f}  p95 {latency['p95']:.1f}  "
+          f"p99 {latency['p99']:.1f}  max {latency['max']:.1f}")
+    print(f"server: {server['ssspRuns']} SSSP runs, {server['coalesced']} coalesced requests")
+    print(json.dumps(server, indent=2))
+
+
+if __name__ == "__main__":
+    main()
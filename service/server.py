@@ -0,0 +1,255 @@
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from ingest.edgelist import loadAdjacencyList
+from mindijkstra.arrayheap import ArrayMinHeap
+from mindijkstra.minheap import MinHeap
+from mindijkstra.mindijkstra_alg_paths import minHeapDijkstrasAlgorithmWithPaths, reconstructPath
+
+HEAP_CLASSES = {"minheap": MinHeap, "minheap-array": ArrayMinHeap}
+
+# Graph and heap of the current worker process, set once by _initWorker.
+_workerEdges = None
+_workerHeapClass = None
+
+
+def _initWorker(edges, heapName):
+    global _workerEdges, _workerHeapClass
+    _workerEdges = edges
+    _workerHeapClass = HEAP_CLASSES[heapName]
+
+
+def _solveSource(source):
+    """Runs one single-source shortest path in a worker process."""
+    return minHeapDijkstrasAlgorithmWithPaths(source, _workerEdges, heapClass=_workerHeapClass)
+
+
+def readEdgeList(path, directed=False):
+    """
+    Reads an edge list (the text format written by `python cli.py generate`, CSV or binary) into an
+    adjacency list with `ingest.edgelist.loadAdjacencyList`. Vertices must be numbered 0 .. V - 1.
+
+    Returns:
+        list: One list of [destination, weight] pairs per vertex.
+    """
+    edges, _ = loadAdjacencyList(path, directed=directed)
+    return edges
+
+
+class ServiceMetrics:
+    """
+    Counters and a sliding window of the latest /path requests (start time and latency of each).
+    """
+
+    def __init__(self, window=10000):
+        self.startedAt = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.ssspRuns = 0
+        self.coalesced = 0
+        self.inFlight = 0
+        self.window = deque(maxlen=window)
+
+    def record(self, startedAt, finishedAt=None):
+        """Adds a completed request, started at `startedAt` (time.perf_counter()), to the window."""
+        if finishedAt is None:
+            finishedAt = time.perf_counter()
+        self.window.append((startedAt, finishedAt - startedAt))
+
+    def snapshot(self, now=None):
+        """
+        Returns:
+            dict: Counters, throughput and latency percentiles in ms. Throughput and latencies describe
+                  the same window: the requests in it divided by the time from the oldest one's start to
+                  now, so the rate falls back to 0 when the server goes idle.
+        """
+        if now is None:
+            now = time.perf_counter()
+        latencies = sorted(latency for _, latency in self.window)
+        windowSeconds = now - self.window[0][0] if self.window else 0.0
+
+        def percentile(fraction):
+            if not latencies:
+                return None
+            return 1000 * latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+        return {
+            "uptimeSeconds": now - self.startedAt,
+            "requests": self.requests,
+            "errors": self.errors,
+            "inFlight": self.inFlight,
+            "ssspRuns": self.ssspRuns,
+            "coalesced": self.coalesced,
+            "windowRequests": len(latencies),
+            "windowSeconds": windowSeconds,
+            "throughputPerSecond": len(latencies) / windowSeconds if windowSeconds > 0 else 0.0,
+            "latencyMs": {
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": 1000 * latencies[-1] if latencies else None,
+            },
+        }
+
+
+class QueryService:
+    """
+    Asyncio shortest-path query server.
+
+    The graph is loaded once and shipped to a pool of worker processes, which run
+    `minHeapDijkstrasAlgorithmWithPaths`. Concurrent requests for the same source are coalesced into a
+    single SSSP run whose result is shared by all of them.
+
+    HTTP endpoints (JSON responses):
+        GET /path?source=S&target=T  -> {"source", "target", "distance", "path"} (distance -1 if unreachable)
+        GET /metrics                 -> ServiceMetrics.snapshot()
+        GET /health                  -> {"status": "ok", "vertices": V}
+    """
+
+    def __init__(self, edges, workers=None, heap="minheap-array"):
+        """
+        Args:
+            edges (list of list): Adjacency list of the graph.
+            workers (int): Number of worker processes. Defaults to the number of CPUs.
+            heap (str): Heap used by the engine, "minheap" or "minheap-array".
+        """
+        self.edges = edges
+        # Workers start on the first /path request, after the sockets are open: forked workers would
+        # inherit them and keep closed connections open, so they are started from a clean process.
+        startMethod = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(startMethod),
+                                            initializer=_initWorker, initargs=(edges, heap))
+        self.pending = {}
+        self.connections = set()
+        self.metrics = ServiceMetrics()
+        self.server = None
+
+    async def shortestPath(self, source, target):
+        """
+        Computes the shortest path from source to target, sharing the SSSP run with any concurrent
+        request for the same source.
+
+        Returns:
+            tuple: (distance, path); (-1, []) if the target is unreachable.
+        """
+        future = self.pending.get(source)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, _solveSource, source)
+            self.pending[source] = future
+            future.add_done_callback(lambda _: self.pending.pop(source, None))
+            self.metrics.ssspRuns += 1
+        else:
+            self.metrics.coalesced += 1
+
+        # Shield the shared run so a cancelled request does not cancel it for the other waiters.
+        minDistances, previousNodes = await asyncio.shield(future)
+        distance = minDistances[target]
+        if distance == float("inf"):
+            return -1, []
+        return distance, reconstructPath(previousNodes, source, target)
+
+    async def route(self, method, target):
+        """
+        Dispatches one HTTP request.
+
+        Returns:
+            tuple: (status line, JSON-serializable body).
+        """
+        url = urlsplit(target)
+        if method != "GET":
+            return "405 Method Not Allowed", {"error": "only GET is supported"}
+        if url.path == "/health":
+            return "200 OK", {"status": "ok", "vertices": len(self.edges)}
+        if url.path == "/metrics":
+            return "200 OK", self.metrics.snapshot()
+        if url.path != "/path":
+            return "404 Not Found", {"error": f"unknown path {url.path}"}
+
+        self.metrics.requests += 1
+        query = parse_qs(url.query)
+        try:
+            source = int(query["source"][0])
+            destination = int(query["target"][0])
+        except (KeyError, ValueError):
+            return "400 Bad Request", {"error": "source and target must be integers"}
+        if not (0 <= source < len(self.edges) and 0 <= destination < len(self.edges)):
+            return "400 Bad Request", {"error": f"vertices must be in [0, {len(self.edges)})"}
+
+        startedAt = time.perf_counter()
+        self.metrics.inFlight += 1
+        try:
+            distance, path = await self.shortestPath(source, destination)
+        finally:
+            self.metrics.inFlight -= 1
+        self.metrics.record(startedAt)
+        return "200 OK", {"source": source, "target": destination, "distance": distance, "path": path}
+
+    async def handleConnection(self, reader, writer):
+        """
+        Serves HTTP/1.1 requests on one connection (keep-alive unless the client sends Connection: close).
+        """
+        task = asyncio.current_task()
+        self.connections.add(task)
+        try:
+            while True:
+                requestLine = await reader.readline()
+                if not requestLine:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, _ = requestLine.decode("latin-1").split()
+                    status, body = await self.route(method, target)
+                except ValueError:
+                    status, body = "400 Bad Request", {"error": "malformed request line"}
+                except Exception as error:
+                    status, body = "500 Internal Server Error", {"error": repr(error)}
+                if not status.startswith("200"):
+                    self.metrics.errors += 1
+
+                keepAlive = headers.get("connection", "").lower() != "close"
+                payload = json.dumps(body).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keepAlive else 'close'}\r\n\r\n".encode() + payload)
+                await writer.drain()
+                if not keepAlive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.connections.discard(task)
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8080):
+        """
+        Starts listening. Use port 0 to pick a free port.
+
+        Returns:
+            int: The port the server is listening on.
+        """
+        self.server = await asyncio.start_server(self.handleConnection, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            # Cancel the open keep-alive connections rather than leaving their tasks pending.
+            connections = list(self.connections)
+            for task in connections:
+                task.cancel()
+            await asyncio.gather(*connections, return_exceptions=True)
+            await self.server.wait_closed()
+        self.executor.shutdown(cancel_futures=True)
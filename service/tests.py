@@ -0,0 +1,105 @@
+import asyncio
+
+from service.loadgen import getJson, runLoad
+from service.server import QueryService, ServiceMetrics
+
+EDGES = [
+    [[1, 7]],                   # Node 0 -> Node 1 (weight 7)
+    [[2, 6], [3, 20], [4, 3]],  # Node 1 -> Node 2 (6), Node 3 (20), Node 4 (3)
+    [[3, 14]],                  # Node 2 -> Node 3 (weight 14)
+    [[4, 2]],                   # Node 3 -> Node 4 (weight 2)
+    [],                         # Node 4 has no outgoing edges
+    []                          # Node 5 has no outgoing edges
+]
+
+
+def test_concurrentRequestsAreCoalesced():
+    """
+    Concurrent queries from the same source share one SSSP run and still get their own paths.
+    """
+    async def scenario():
+        service = QueryService(EDGES, workers=1)
+        try:
+            results = await asyncio.gather(*(service.shortestPath(0, target) for target in [3, 4, 5] * 5))
+        finally:
+            await service.close()
+        return service.metrics, results
+
+    metrics, results = asyncio.run(scenario())
+    assert metrics.ssspRuns == 1
+    assert metrics.coalesced == 14
+    assert results[:3] == [(27, [0, 1, 2, 3]), (10, [0, 1, 4]), (-1, [])]
+
+
+def test_httpEndpoints():
+    """
+    The HTTP interface answers /path, /health and /metrics, and rejects invalid queries.
+    """
+    async def scenario():
+        service = QueryService(EDGES, workers=1)
+        port = await service.start("127.0.0.1", 0)
+        try:
+            path = await getJson("127.0.0.1", port, "/path?source=0&target=3")
+            invalid = await getJson("127.0.0.1", port, "/path?source=0&target=99")
+            load = await runLoad("127.0.0.1", port, requests=50, concurrency=5, hotSources=2)
+            metrics = await getJson("127.0.0.1", port, "/metrics")
+        finally:
+            await service.close()
+        return path, invalid, load, metrics
+
+    path, invalid, load, metrics = asyncio.run(scenario())
+    assert path == {"source": 0, "target": 3, "distance": 27, "path": [0, 1, 2, 3]}
+    assert "error" in invalid
+    assert load["requests"] == 50 and load["errors"] == 0
+    assert metrics["requests"] == 52 and metrics["errors"] == 1
+    assert metrics["ssspRuns"] + metrics["coalesced"] == 51
+
+
+def test_connectionsAreClosed():
+    """
+    A Connection: close client sees EOF once the worker processes are running, and closing the service
+    ends the keep-alive connections still open instead of leaving their tasks pending.
+    """
+    async def scenario():
+        service = QueryService(EDGES, workers=2)
+        port = await service.start("127.0.0.1", 0)
+        try:
+            await getJson("127.0.0.1", port, "/path?source=0&target=3")
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /path?source=1&target=4 HTTP/1.1\r\nConnection: close\r\n\r\n")
+            response = await asyncio.wait_for(reader.read(), timeout=10)
+            writer.close()
+
+            idleReader, idleWriter = await asyncio.open_connection("127.0.0.1", port)
+            idleWriter.write(b"GET /health HTTP/1.1\r\n\r\n")
+            await idleReader.readline()
+        finally:
+            await service.close()
+        leftOver = await asyncio.wait_for(idleReader.read(), timeout=10)
+        idleWriter.close()
+        return response, leftOver, service.connections
+
+    response, leftOver, connections = asyncio.run(scenario())
+    assert response.endswith(b'"distance": 3, "path": [1, 4]}')
+    assert b"Connection: close" in response
+    assert b'"status": "ok"' in leftOver
+    assert not connections
+
+
+def test_throughputUsesTheLatencyWindow():
+    """
+    Throughput is computed over the same sliding window as the latencies, not over the whole uptime.
+    """
+    metrics = ServiceMetrics(window=4)
+    for idx in range(10):
+        metrics.record(startedAt=100.0 + idx, finishedAt=100.5 + idx)
+
+    # The window holds the requests started at 106 .. 109
+    busy = metrics.snapshot(now=110.0)
+    assert busy["windowRequests"] == 4 and busy["windowSeconds"] == 4.0
+    assert busy["throughputPerSecond"] == 1.0
+    assert busy["latencyMs"]["p50"] == 500.0
+
+    # Idle for a while: the same window now spans longer, so the rate drops
+    assert metrics.snapshot(now=130.0)["throughputPerSecond"] == 4 / 24
+    assert ServiceMetrics().snapshot()["throughputPerSecond"] == 0.0